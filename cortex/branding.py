@@ -11,10 +11,15 @@ Enhanced with rich output formatting (Issue #242):
 - Consistent visual language
 """
 
+from collections.abc import Iterator
+from contextlib import contextmanager
+
 from rich import box
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
+from rich.protocol import is_renderable
 from rich.table import Table
+from rich.text import Text
 
 console = Console()
 
@@ -44,19 +49,47 @@ LOGO_SMALL = """[bold cyan]╔═╗─┐ ┬[/bold cyan]
 # Version info
 VERSION = "0.1.0"
 
+# Pre-styled CX badge and status icons, built once so cx_print only has to
+# parse markup in the message itself
+_BADGE = Text(" CX ", style="bold white on dark_cyan")
+
+_STATUS_ICONS = {
+    "info": Text("│", style="dim"),
+    "success": Text("✓", style="green"),
+    "warning": Text("⚠", style="yellow"),
+    "error": Text("✗", style="red"),
+    "thinking": Text("⠋", style="cyan"),  # Spinner frame
+}
+
+# Complete "CX <icon> " line prefixes; each message only appends its own text
+_LINE_PREFIXES = {
+    status: Text.assemble(_BADGE, " ", icon, " ") for status, icon in _STATUS_ICONS.items()
+}
+
 
 def show_banner(show_version: bool = True):
     """
     Display the full Cortex banner.
     Called on first run or with --version flag.
     """
-    content = LOGO_LARGE + "\n"
-    content += "[dim]CortexLinux[/dim] [white]• AI-Powered Package Manager[/white]"
+    lines = [LOGO_LARGE, "[dim]CortexLinux[/dim] [white]• AI-Powered Package Manager[/white]"]
 
     if show_version:
-        content += f"\n[dim]v{VERSION}[/dim]"
+        lines.append(f"[dim]v{VERSION}[/dim]")
+
+    console.print(Panel("\n".join(lines), border_style="cyan", padding=(0, 2)))
 
-    console.print(Panel(content, border_style="cyan", padding=(0, 2)))
+
+@contextmanager
+def cx_buffered() -> Iterator[None]:
+    """
+    Batch console output into a single write.
+
+    Everything printed through the shared console inside the block is
+    buffered and written (and flushed) once when the block exits.
+    """
+    with console:
+        yield
 
 
 def cx_print(message: str, status: str = "info"):
@@ -68,18 +101,19 @@ def cx_print(message: str, status: str = "info"):
         message: The message to display
         status: One of "info", "success", "warning", "error", "thinking"
     """
-    badge = "[bold white on dark_cyan] CX [/bold white on dark_cyan]"
+    console.print(cx_line(message, status))
+
+
+def cx_line(message: str, status: str = "info") -> Text:
+    """Build the line cx_print prints, for use inside a larger renderable."""
+    return _prefixed(_LINE_PREFIXES.get(status, _LINE_PREFIXES["info"]), message)
 
-    status_icons = {
-        "info": "[dim]│[/dim]",
-        "success": "[green]✓[/green]",
-        "warning": "[yellow]⚠[/yellow]",
-        "error": "[red]✗[/red]",
-        "thinking": "[cyan]⠋[/cyan]",  # Spinner frame
-    }
 
-    icon = status_icons.get(status, status_icons["info"])
-    console.print(f"{badge} {icon} {message}")
+def _prefixed(prefix: Text, message: str) -> Text:
+    """Append a message (markup allowed) to a copy of a pre-styled prefix."""
+    line = prefix.copy()
+    line.append_text(console.render_str(message))
+    return line
 
 
 def cx_step(step_num: int, total: int, message: str):
@@ -88,17 +122,21 @@ def cx_step(step_num: int, total: int, message: str):
 
     Example: CX │ [1/4] Updating package lists...
     """
-    badge = "[bold white on dark_cyan] CX [/bold white on dark_cyan]"
-    console.print(f"{badge} [dim]│[/dim] [{step_num}/{total}] {message}")
+    console.print(_prefixed(_LINE_PREFIXES["info"], f"[{step_num}/{total}] {message}"))
 
 
 def cx_header(title: str):
     """
     Print a section header.
+
+    Surrounding blank lines are part of the same print call.
     """
-    console.print()
-    console.print(f"[bold cyan]━━━ {title} ━━━[/bold cyan]")
-    console.print()
+    console.print(cx_header_text(title))
+
+
+def cx_header_text(title: str) -> Text:
+    """Build the section header cx_header prints, for use inside a larger renderable."""
+    return console.render_str(f"\n[bold cyan]━━━ {title} ━━━[/bold cyan]\n")
 
 
 def cx_table_header():
@@ -116,26 +154,42 @@ def show_welcome():
     """
     First-run welcome message.
     """
-    show_banner()
-    console.print()
-    cx_print("Welcome to Cortex! Let's get you set up.", "success")
-    cx_print("Run [bold]cortex wizard[/bold] to configure your API key.", "info")
-    console.print()
+    with cx_buffered():
+        show_banner()
+        console.print()
+        cx_print("Welcome to Cortex! Let's get you set up.", "success")
+        cx_print("Run [bold]cortex wizard[/bold] to configure your API key.", "info")
+        console.print()
 
 
 def show_goodbye():
     """
     Exit message.
     """
-    console.print()
-    cx_print("Done! Run [bold]cortex --help[/bold] for more commands.", "info")
-    console.print()
+    goodbye = cx_line("Done! Run [bold]cortex --help[/bold] for more commands.", "info")
+    console.print(Group(Text(), goodbye, Text()))
 
 
 # ============================================
 # Rich Output Formatting (Issue #242)
 # ============================================
 
+# Style lookups shared by every box, built once rather than per call
+_BOX_BORDER_COLORS = {
+    "info": CORTEX_CYAN,
+    "success": CORTEX_SUCCESS,
+    "warning": CORTEX_WARNING,
+    "error": CORTEX_ERROR,
+}
+
+_STATUS_VALUE_COLORS = {
+    "success": CORTEX_SUCCESS,
+    "warning": CORTEX_WARNING,
+    "error": CORTEX_ERROR,
+    "info": CORTEX_CYAN,
+    "default": "white",
+}
+
 
 def cx_box(
     content: str,
@@ -152,13 +206,7 @@ def cx_box(
         subtitle: Optional box subtitle
         status: Style - "info", "success", "warning", "error"
     """
-    border_colors = {
-        "info": CORTEX_CYAN,
-        "success": CORTEX_SUCCESS,
-        "warning": CORTEX_WARNING,
-        "error": CORTEX_ERROR,
-    }
-    border_style = border_colors.get(status, CORTEX_CYAN)
+    border_style = _BOX_BORDER_COLORS.get(status, CORTEX_CYAN)
 
     panel = Panel(
         content,
@@ -191,23 +239,21 @@ def cx_status_box(
         items: List of (label, value, status) tuples
                status: "success", "warning", "error", "info", "default"
     """
-    style_colors = {
-        "success": CORTEX_SUCCESS,
-        "warning": CORTEX_WARNING,
-        "error": CORTEX_ERROR,
-        "info": CORTEX_CYAN,
-        "default": "white",
-    }
-
     max_label_len = max(len(item[0]) for item in items) if items else 0
-    lines = []
-
-    for label, value, status in items:
-        color = style_colors.get(status, "white")
-        padded_label = label.ljust(max_label_len)
-        lines.append(f"  [dim]{padded_label}:[/dim]  [{color}]{value}[/{color}]")
 
-    content = "\n".join(lines)
+    # Rows are styled Text rather than markup, so labels and values are
+    # rendered literally and never go through the markup parser
+    lines = [
+        Text.assemble(
+            "  ",
+            (f"{label.ljust(max_label_len)}:", "dim"),
+            "  ",
+            (str(value), _STATUS_VALUE_COLORS.get(status, "white")),
+        )
+        for label, value, status in items
+    ]
+
+    content = Text("\n").join(lines)
     panel = Panel(
         content,
         title=f"[bold cyan]{title}[/bold cyan]",
@@ -247,7 +293,8 @@ def cx_table(
 
     for i, row in enumerate(rows):
         style = row_styles[i] if row_styles and i < len(row_styles) else None
-        table.add_row(*row, style=style)
+        # Numbers and other plain values are stringified; renderables pass through
+        table.add_row(*(c if is_renderable(c) else str(c) for c in row), style=style)
 
     console.print(table)
 
@@ -278,11 +325,12 @@ def cx_package_table(
 
     for name, version, action in packages:
         # Color-code actions
-        if "install" in action.lower():
+        action_lower = action.lower()
+        if "install" in action_lower:
             action_styled = f"[green]{action}[/green]"
-        elif "remove" in action.lower() or "uninstall" in action.lower():
+        elif "remove" in action_lower or "uninstall" in action_lower:
             action_styled = f"[red]{action}[/red]"
-        elif "update" in action.lower() or "upgrade" in action.lower():
+        elif "update" in action_lower or "upgrade" in action_lower:
             action_styled = f"[yellow]{action}[/yellow]"
         else:
             action_styled = action
@@ -304,9 +352,15 @@ def cx_divider(title: str | None = None) -> None:
         console.print(f"[{CORTEX_CYAN}]{'━' * 50}[/{CORTEX_CYAN}]")
 
 
+# Pre-styled "<icon> " prefixes for the plain-message helpers below
+_SUCCESS_PREFIX = Text.assemble(("✓", CORTEX_SUCCESS), " ")
+_INFO_PREFIX = Text.assemble(("ℹ", CORTEX_INFO), " ")
+_SPINNER_PREFIX = Text.assemble(("⠋", CORTEX_CYAN), " ")
+
+
 def cx_success(message: str) -> None:
     """Print a success message with checkmark."""
-    console.print(f"[{CORTEX_SUCCESS}]✓[/{CORTEX_SUCCESS}] {message}")
+    console.print(_prefixed(_SUCCESS_PREFIX, message))
 
 
 def cx_error(message: str) -> None:
@@ -323,12 +377,12 @@ def cx_warning(message: str) -> None:
 
 def cx_info(message: str) -> None:
     """Print an info message with info icon."""
-    console.print(f"[{CORTEX_INFO}]ℹ[/{CORTEX_INFO}] {message}")
+    console.print(_prefixed(_INFO_PREFIX, message))
 
 
 def cx_spinner_message(message: str) -> None:
     """Print a message with spinner icon (static, for logs)."""
-    console.print(f"[{CORTEX_CYAN}]⠋[/{CORTEX_CYAN}] {message}")
+    console.print(_prefixed(_SPINNER_PREFIX, message))
 
 
 # Demo
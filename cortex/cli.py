@@ -543,8 +543,8 @@ class CortexCLI:
         """Preview packages that would be installed without executing."""
         cx_print(f"\n📋 {t('stack.installing', name=stack['name'])}", "info")
         console.print(f"\n{t('stack.dry_run_preview')}:")
-        for pkg in packages:
-            console.print(f"  • {pkg}")
+        if packages:
+            console.print("\n".join([f"  • {pkg}" for pkg in packages]))
         console.print(f"\n{t('stack.packages_total', count=len(packages))}")
         cx_print(f"\n{t('stack.dry_run_note')}", "warning")
         return 0
@@ -3036,35 +3036,16 @@ def _normalize_for_lookup(s: str) -> str:
     return s
 
 
-def _resolve_language_name(name: str) -> str | None:
+def _build_name_to_code() -> dict[str, str]:
     """
-    Resolve a language name or code to a supported language code.
-
-    Accepts:
-    - Language codes: en, es, fr, de, zh
-    - English names: English, Spanish, French, German, Chinese
-    - Native names: Español, Français, Deutsch, 中文
-
-    Args:
-        name: Language name or code (case-insensitive for Latin scripts)
-
-    Returns:
-        Language code if found, None otherwise
+    Build the lookup table used by _resolve_language_name.
 
-    Note:
-        Non-Latin scripts (e.g., Chinese 中文) are matched exactly without
-        case normalization, since .lower() is meaningless for these scripts
-        and could create key collisions.
+    Maps every accepted alias to its language code:
+    - English names, casefolded
+    - Native names, normalized with _normalize_for_lookup, plus the original
+      spelling when normalization changes it
+    - Language codes, which take precedence over any colliding name
     """
-    name = name.strip()
-    name_normalized = _normalize_for_lookup(name)
-
-    # Direct code match (codes are always ASCII/lowercase)
-    if name_normalized in SUPPORTED_LANGUAGES:
-        return name_normalized
-
-    # Build lookup tables for names
-    # Using a list of tuples to handle potential key collisions properly
     name_to_code: dict[str, str] = {}
 
     for code, info in SUPPORTED_LANGUAGES.items():
@@ -3085,15 +3066,46 @@ def _resolve_language_name(name: str) -> str | None:
         if native_name != native_normalized:
             name_to_code[native_name] = code
 
-    # Try to find a match using normalized input
-    if name_normalized in name_to_code:
-        return name_to_code[name_normalized]
+    # Codes are always ASCII/lowercase and win over names
+    name_to_code.update((code, code) for code in SUPPORTED_LANGUAGES)
+    return name_to_code
+
+
+_NAME_TO_CODE = _build_name_to_code()
 
-    # Try exact match for non-ASCII input
-    if name in name_to_code:
-        return name_to_code[name]
 
-    return None
+def _resolve_language_name(name: str) -> str | None:
+    """
+    Resolve a language name or code to a supported language code.
+
+    Accepts:
+    - Language codes: en, es, fr, de, zh
+    - English names: English, Spanish, French, German, Chinese
+    - Native names: Español, Français, Deutsch, 中文
+
+    Args:
+        name: Language name or code (case-insensitive for Latin scripts)
+
+    Returns:
+        Language code if found, None otherwise
+
+    Note:
+        Non-Latin scripts (e.g., Chinese 中文) are matched exactly without
+        case normalization, since .lower() is meaningless for these scripts
+        and could create key collisions.
+
+        Only exact aliases match. Both lookups are single dict hits against
+        _NAME_TO_CODE; prefix or substring matching ("Span", "Deutsc") is
+        deliberately unsupported, so unknown input costs no more than a hit.
+    """
+    name = name.strip()
+
+    # Try to find a match using normalized input
+    code = _NAME_TO_CODE.get(_normalize_for_lookup(name))
+    if code is None:
+        # Try exact match for non-ASCII input
+        code = _NAME_TO_CODE.get(name)
+    return code
 
 
 def _handle_set_language(language_input: str) -> int:
@@ -3311,8 +3323,8 @@ def main():
         "action",
         nargs="?",
         default="status",
-        choices=["status", "modes", "switch", "apps"],
-        help="Action: status (default), modes, switch, apps",
+        choices=["status", "modes", "switch", "apps", "all"],
+        help="Action: status (default), modes, switch, apps, all",
     )
     gpu_parser.add_argument(
         "mode", nargs="?", help="Mode for switch action (integrated/hybrid/nvidia)"
@@ -9,15 +9,19 @@ Issue: #454
 
 import re
 import subprocess
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
+from types import MappingProxyType
 
 from rich import box
+from rich.console import Group, RenderableType
 from rich.panel import Panel
 from rich.table import Table
+from rich.text import Text
 
-from cortex.branding import CORTEX_CYAN, console, cx_header, cx_print
+from cortex.branding import CORTEX_CYAN, console, cx_header_text, cx_line, cx_print
 
 
 class GPUMode(Enum):
@@ -84,7 +88,7 @@ class AppGPUConfig:
 
 
 # Battery impact estimates (hours difference)
-BATTERY_IMPACT = {
+_BATTERY_IMPACT = {
     GPUMode.INTEGRATED: {"description": "Best battery life", "impact": "+2-4 hours"},
     GPUMode.HYBRID: {"description": "Balanced", "impact": "+1-2 hours"},
     GPUMode.NVIDIA: {"description": "Full performance", "impact": "Baseline"},
@@ -92,7 +96,7 @@ BATTERY_IMPACT = {
 }
 
 # Common apps and their recommended GPU
-APP_GPU_RECOMMENDATIONS = {
+_APP_GPU_RECOMMENDATIONS = {
     "steam": GPUVendor.NVIDIA,
     "blender": GPUVendor.NVIDIA,
     "davinci-resolve": GPUVendor.NVIDIA,
@@ -105,6 +109,42 @@ APP_GPU_RECOMMENDATIONS = {
     "gimp": GPUVendor.INTEL,
 }
 
+# Read-only public views of the lookup tables above
+BATTERY_IMPACT = MappingProxyType(_BATTERY_IMPACT)
+APP_GPU_RECOMMENDATIONS = MappingProxyType(_APP_GPU_RECOMMENDATIONS)
+
+
+def _table_renderable(table: Table, rows: Sequence[Sequence[str | Text]]) -> RenderableType:
+    """
+    Fill a Rich table with rows, or lay them out as plain aligned text when not a terminal.
+
+    Piped or redirected output skips Rich's table layout and styling entirely.
+
+    Args:
+        table: Table with its columns already configured
+        rows: Row cells; styled cells are given as Text
+
+    Returns:
+        The filled table, or unstyled Text
+    """
+    if console.is_terminal:
+        for row in rows:
+            table.add_row(*row)
+        return table
+
+    lines = [tuple(str(column.header) for column in table.columns)]
+    lines.extend(tuple(str(cell) for cell in row) for row in rows)
+    widths = [max(len(line[i]) for line in lines) for i in range(len(lines[0]))]
+    plain = "\n".join(
+        "  ".join(cell.ljust(width) for cell, width in zip(line, widths)).rstrip() for line in lines
+    )
+    return Text(plain, no_wrap=True, overflow="ignore")
+
+
+def _print(renderable: RenderableType) -> None:
+    """Print a built renderable without cropping plain-text tables."""
+    console.print(renderable, crop=False)
+
 
 class HybridGPUManager:
     """
@@ -394,13 +434,34 @@ class HybridGPUManager:
 
     def display_status(self):
         """Display current GPU status with rich formatting."""
+        _print(self._build_status_renderable())
+
+    def display_modes(self):
+        """Display available GPU modes with descriptions."""
+        _print(self._build_modes_renderable())
+
+    def display_app_recommendations(self):
+        """Display per-app GPU recommendations."""
+        _print(self._build_apps_renderable())
+
+    def display_all(self):
+        """Display status, modes and app recommendations in a single print."""
+        _print(
+            Group(
+                self._build_status_renderable(),
+                self._build_modes_renderable(),
+                self._build_apps_renderable(),
+            )
+        )
+
+    def _build_status_renderable(self) -> RenderableType:
+        """Build the GPU status section shown by display_status."""
         state = self.get_state(refresh=True)
 
-        cx_header("GPU Status")
+        header = cx_header_text("GPU Status")
 
         if not state.devices:
-            cx_print("No GPUs detected", "warning")
-            return
+            return Group(header, cx_line("No GPUs detected", "warning"))
 
         # GPU devices table
         table = Table(
@@ -414,22 +475,22 @@ class HybridGPUManager:
         table.add_column("Status", style="green")
         table.add_column("Memory", style="white")
 
+        rows = []
         for device in state.devices:
             vendor_str = device.vendor.value.upper()
 
             if device.is_active or device.power_state == "active":
-                status = "[green]● Active[/green]"
+                status = Text("● Active", style="green")
             elif device.power_state == "suspended":
-                status = "[yellow]○ Suspended[/yellow]"
+                status = Text("○ Suspended", style="yellow")
             else:
-                status = "[dim]○ Idle[/dim]"
+                status = Text("○ Idle", style="dim")
 
             memory = f"{device.memory_mb} MB" if device.memory_mb else "N/A"
 
-            table.add_row(device.name[:40], vendor_str, status, memory)
+            rows.append((device.name[:40], vendor_str, status, memory))
 
-        console.print(table)
-        console.print()
+        renderables: list[RenderableType] = [header, _table_renderable(table, rows), Text()]
 
         # Current mode
         mode_colors = {
@@ -447,7 +508,7 @@ class HybridGPUManager:
 [dim]{mode_info['description']}[/dim]
 Battery Impact: {mode_info['impact']}
 """
-        console.print(
+        renderables.append(
             Panel(
                 mode_panel,
                 title="[bold cyan]GPU Mode[/bold cyan]",
@@ -457,13 +518,18 @@ Battery Impact: {mode_info['impact']}
         )
 
         if state.is_hybrid_system:
-            console.print()
-            console.print("[bold]Hybrid GPU System Detected[/bold]")
-            console.print("[dim]Use 'cortex gpu switch <mode>' to change modes[/dim]")
+            renderables.append(
+                console.render_str(
+                    "\n[bold]Hybrid GPU System Detected[/bold]\n"
+                    "[dim]Use 'cortex gpu switch <mode>' to change modes[/dim]"
+                )
+            )
 
-    def display_modes(self):
-        """Display available GPU modes with descriptions."""
-        cx_header("Available GPU Modes")
+        return Group(*renderables)
+
+    def _build_modes_renderable(self) -> RenderableType:
+        """Build the GPU modes section shown by display_modes."""
+        header = cx_header_text("Available GPU Modes")
 
         table = Table(
             show_header=True,
@@ -483,14 +549,15 @@ Battery Impact: {mode_info['impact']}
             (GPUMode.COMPUTE, "NVIDIA for compute", "Medium", "ML training, rendering"),
         ]
 
-        for mode, desc, battery, best_for in modes_info:
-            table.add_row(mode.value.upper(), desc, battery, best_for)
-
-        console.print(table)
+        rows = [
+            (mode.value.upper(), desc, battery, best_for)
+            for mode, desc, battery, best_for in modes_info
+        ]
+        return Group(header, _table_renderable(table, rows))
 
-    def display_app_recommendations(self):
-        """Display per-app GPU recommendations."""
-        cx_header("App GPU Recommendations")
+    def _build_apps_renderable(self) -> RenderableType:
+        """Build the app recommendations section shown by display_app_recommendations."""
+        header = cx_header_text("App GPU Recommendations")
 
         table = Table(
             show_header=True,
@@ -504,22 +571,22 @@ Battery Impact: {mode_info['impact']}
 
         state = self.get_state()
 
+        rows = []
         for app, gpu in APP_GPU_RECOMMENDATIONS.items():
-            gpu_str = gpu.value.upper()
             if gpu == GPUVendor.NVIDIA:
                 launch_cmd = self.get_app_launch_command(app, use_nvidia=True)
-                gpu_str = f"[yellow]{gpu_str}[/yellow]"
+                gpu_str = Text(gpu.value.upper(), style="yellow")
             else:
                 launch_cmd = app
-                gpu_str = f"[green]{gpu_str}[/green]"
+                gpu_str = Text(gpu.value.upper(), style="green")
 
             # Truncate launch command if too long
             if len(launch_cmd) > 50:
                 launch_cmd = launch_cmd[:47] + "..."
 
-            table.add_row(app, gpu_str, launch_cmd)
+            rows.append((app, gpu_str, launch_cmd))
 
-        console.print(table)
+        return Group(header, _table_renderable(table, rows))
 
 
 def run_gpu_manager(action: str = "status", mode: str | None = None, verbose: bool = False) -> int:
@@ -527,7 +594,7 @@ def run_gpu_manager(action: str = "status", mode: str | None = None, verbose: bo
     Main entry point for cortex gpu command.
 
     Args:
-        action: One of "status", "modes", "switch", "apps"
+        action: One of "status", "modes", "switch", "apps", "all"
         mode: Target mode for switch action
         verbose: Verbose output
 
@@ -542,6 +609,8 @@ def run_gpu_manager(action: str = "status", mode: str | None = None, verbose: bo
         manager.display_modes()
     elif action == "apps":
         manager.display_app_recommendations()
+    elif action == "all":
+        manager.display_all()
     elif action == "switch":
         if not mode:
             cx_print("Specify a mode: integrated, hybrid, nvidia", "error")
@@ -66,15 +66,17 @@ class LanguageConfig:
         from multiple threads and multiple processes.
     """
 
+    # Parsed preferences shared by all instances, keyed by file path and
+    # validated against the file's (inode, mtime_ns, size) before each use
+    _preferences_cache: dict[Path, tuple[tuple[int, int, int], dict[str, Any]]] = {}
+    _preferences_cache_lock = threading.Lock()
+
     def __init__(self) -> None:
         """Initialize the language configuration manager."""
         self.cortex_dir = Path.home() / ".cortex"
         self.preferences_file = self.cortex_dir / "preferences.yaml"
         self._thread_lock = threading.Lock()
 
-        # Ensure directory exists
-        self.cortex_dir.mkdir(mode=0o700, exist_ok=True)
-
     def _acquire_file_lock(self, file_obj: Any, exclusive: bool = False) -> None:
         """
         Acquire a file lock for concurrent access.
@@ -117,9 +119,38 @@ class LanguageConfig:
             except OSError as e:
                 logger.debug(f"Could not release file lock: {e}")
 
+    def _read_preferences_text(self, st: os.stat_result) -> str:
+        """
+        Read the raw preferences file with proper locking.
+
+        Args:
+            st: stat() result the caller already took for the preferences file
+
+        Returns:
+            File contents, or an empty string if the file is empty
+
+        Raises:
+            OSError: If the file cannot be read (including if it was removed
+                after the caller's stat())
+
+        Note:
+            A zero-length file is detected from the stat() result alone,
+            skipping the open/flock/read round-trip.
+        """
+        if st.st_size == 0:
+            return ""
+
+        with self._thread_lock:
+            with open(self.preferences_file, encoding="utf-8") as f:
+                self._acquire_file_lock(f, exclusive=False)  # Shared lock for reading
+                try:
+                    return f.read()
+                finally:
+                    self._release_file_lock(f)
+
     def _load_preferences(self) -> dict[str, Any]:
         """
-        Load preferences from file with proper locking.
+        Load and parse preferences from file.
 
         Returns:
             Dictionary of preferences, or empty dict on failure
@@ -129,41 +160,33 @@ class LanguageConfig:
             - Malformed YAML (returns empty dict, logs warning)
             - Empty file (returns empty dict)
             - Invalid types (returns empty dict if not a dict)
-            - Race conditions (uses both thread and file locks)
+            - Race conditions (reads through _read_preferences_text)
 
         Note:
-            The exists() check and file read are both inside the critical section
-            to prevent TOCTOU (time-of-check to time-of-use) race conditions.
+            Parsed preferences are cached per file and reused while the file's
+            inode, mtime and size are unchanged, so repeated reads skip
+            open/parse. The file is stat()ed once per call. Callers get their
+            own copy and may modify it.
         """
         try:
-            with self._thread_lock:
-                if not self.preferences_file.exists():
-                    return {}
+            st = os.stat(self.preferences_file)
+        except OSError:
+            # Missing file, or one we can't stat
+            return {}
 
-                with open(self.preferences_file, encoding="utf-8") as f:
-                    self._acquire_file_lock(f, exclusive=False)  # Shared lock for reading
-                    try:
-                        content = f.read()
-                        if not content.strip():
-                            # Empty file
-                            return {}
-
-                        data = yaml.safe_load(content)
-
-                        # Validate that we got a dict
-                        if data is None:
-                            return {}
-                        if not isinstance(data, dict):
-                            logger.warning(
-                                f"Preferences file contains invalid type: {type(data).__name__}, "
-                                "expected dict. Using defaults."
-                            )
-                            return {}
-
-                        return data
-                    finally:
-                        self._release_file_lock(f)
+        stat_key = self._stat_key(st)
+        with self._preferences_cache_lock:
+            cached = self._preferences_cache.get(self.preferences_file)
+        if cached is not None and cached[0] == stat_key:
+            return dict(cached[1])
+
+        try:
+            content = self._read_preferences_text(st)
+            if not content.strip():
+                # Missing or empty file
+                return {}
 
+            data = yaml.safe_load(content)
         except yaml.YAMLError as e:
             # Log the YAML parsing error but don't crash
             logger.warning(f"Malformed YAML in preferences file: {e}. Using defaults.")
@@ -173,6 +196,62 @@ class LanguageConfig:
             logger.debug(f"Could not read preferences file: {e}")
             return {}
 
+        # Validate that we got a dict
+        if data is None:
+            return {}
+        if not isinstance(data, dict):
+            logger.warning(
+                f"Preferences file contains invalid type: {type(data).__name__}, "
+                "expected dict. Using defaults."
+            )
+            return {}
+
+        self._cache_preferences(stat_key, data)
+        return dict(data)
+
+    @staticmethod
+    def _stat_key(st: os.stat_result) -> tuple[int, int, int]:
+        """
+        Build the cache validation key for a preferences file stat() result.
+
+        The inode is part of the key because _save_preferences replaces the
+        file by renaming a temp file over it: switching between two-letter
+        language codes keeps the size, and may land in the same mtime tick.
+
+        Args:
+            st: stat() result for the preferences file
+
+        Returns:
+            (inode, mtime_ns, size)
+        """
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    def _preferences_stat_key(self) -> tuple[int, int, int] | None:
+        """
+        Get the preferences file's cache validation key.
+
+        Returns:
+            The stat key, or None if the file is missing or can't be stat'ed
+        """
+        try:
+            st = os.stat(self.preferences_file)
+        except OSError:
+            return None
+        return self._stat_key(st)
+
+    def _cache_preferences(
+        self, stat_key: tuple[int, int, int], preferences: dict[str, Any]
+    ) -> None:
+        """
+        Remember parsed preferences for the current preferences file.
+
+        Args:
+            stat_key: (inode, mtime_ns, size) of the file the preferences came from
+            preferences: Parsed preferences; a copy is stored
+        """
+        with self._preferences_cache_lock:
+            self._preferences_cache[self.preferences_file] = (stat_key, dict(preferences))
+
     def _save_preferences(self, preferences: dict[str, Any]) -> None:
         """
         Save preferences to file with proper locking.
@@ -191,6 +270,9 @@ class LanguageConfig:
 
         try:
             with self._thread_lock:
+                # Create the directory lazily so read-only sessions never touch disk
+                self.cortex_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+
                 # Write atomically by writing to temp file first, then renaming
                 temp_file = self.preferences_file.with_suffix(".yaml.tmp")
 
@@ -204,6 +286,11 @@ class LanguageConfig:
                 # Atomic rename
                 temp_file.rename(self.preferences_file)
 
+                # Readers reuse what was just written instead of re-parsing it
+                stat_key = self._preferences_stat_key()
+                if stat_key is not None:
+                    self._cache_preferences(stat_key, preferences)
+
         except OSError as e:
             error_msg = t("language.set_failed", error=str(e))
             raise RuntimeError(error_msg) from e
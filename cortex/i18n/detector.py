@@ -10,6 +10,7 @@ Detects the system language from environment variables:
 
 from __future__ import annotations
 
+import functools
 import os
 import re
 from typing import TYPE_CHECKING
@@ -71,11 +72,21 @@ LANGUAGE_MAPPINGS = {
     "posix": "en",  # POSIX locale defaults to English
 }
 
+# Precompiled suffix patterns used by _parse_locale
+# Matches: .encoding or .encoding@modifier (e.g., .UTF-8, .utf8@euro)
+_ENCODING_SUFFIX_RE = re.compile(r"\.[a-z0-9_-]+(@[a-z]+)?$")
+# Matches: @modifier (e.g., @latin, @cyrillic)
+_MODIFIER_SUFFIX_RE = re.compile(r"@[a-z]+$")
 
+
+@functools.lru_cache(maxsize=32)
 def _parse_locale(locale_string: str) -> str | None:
     """
     Parse a locale string and extract the language code.
 
+    Results are memoized: locale strings come from a handful of environment
+    variables that rarely change within a process.
+
     Handles formats like:
     - en_US.UTF-8
     - es_ES
@@ -107,29 +118,31 @@ def _parse_locale(locale_string: str) -> str | None:
 
     # Remove encoding suffix (e.g., .UTF-8, .utf8)
     # Pattern matches: .encoding or .encoding@modifier
-    locale_lower = re.sub(r"\.[a-z0-9_-]+(@[a-z]+)?$", "", locale_lower)
+    if "." in locale_lower:
+        locale_lower = _ENCODING_SUFFIX_RE.sub("", locale_lower)
 
     # Remove @modifier suffix (e.g., @latin, @cyrillic)
     # This handles cases like "sr_rs@latin" after encoding is already removed
-    locale_lower = re.sub(r"@[a-z]+$", "", locale_lower)
+    if "@" in locale_lower:
+        locale_lower = _MODIFIER_SUFFIX_RE.sub("", locale_lower)
 
     # Try direct mapping first (e.g., "en_us", "zh_cn")
-    if locale_lower in LANGUAGE_MAPPINGS:
-        return LANGUAGE_MAPPINGS[locale_lower]
+    mapped = LANGUAGE_MAPPINGS.get(locale_lower)
+    if mapped is not None:
+        return mapped
 
     # Try just the language part (before underscore)
-    if "_" in locale_lower:
-        lang_part = locale_lower.split("_")[0]
-        if lang_part in LANGUAGE_MAPPINGS:
-            return LANGUAGE_MAPPINGS[lang_part]
-
-        # Try full locale for regional variants (already normalized)
-        if locale_lower in LANGUAGE_MAPPINGS:
-            return LANGUAGE_MAPPINGS[locale_lower]
+    lang_part, sep, _ = locale_lower.partition("_")
+    if sep:
+        return LANGUAGE_MAPPINGS.get(lang_part)
 
     return None
 
 
+# Environment variables to check, in priority order
+_DETECTION_ENV_VARS = ("LANGUAGE", "LC_ALL", "LC_MESSAGES", "LANG")
+
+
 def detect_os_language() -> str:
     """
     Detect the OS language from environment variables.
@@ -150,24 +163,33 @@ def detect_os_language() -> str:
         With LC_ALL=fr_FR: returns 'fr'
         With LANGUAGE=de: returns 'de'
     """
-    # Environment variables to check, in priority order
-    env_vars = ["LANGUAGE", "LC_ALL", "LC_MESSAGES", "LANG"]
+    return _detect(*(os.environ.get(var, "") for var in _DETECTION_ENV_VARS))
 
-    for var in env_vars:
-        value = os.environ.get(var, "")
-        if not value:
-            continue
-
-        # LANGUAGE can have multiple values separated by ':'
-        if var == "LANGUAGE":
-            for lang_part in value.split(":"):
-                parsed = _parse_locale(lang_part)
-                if parsed and parsed in _get_supported_language_codes():
-                    return parsed
-        else:
-            parsed = _parse_locale(value)
-            if parsed and parsed in _get_supported_language_codes():
-                return parsed
+
+@functools.lru_cache(maxsize=16)
+def _detect(language: str, lc_all: str, lc_messages: str, lang: str) -> str:
+    """
+    Detect the language from the given environment variable values.
+
+    Memoized on the values themselves, so a changed environment can never
+    be served a stale result.
+
+    Args:
+        language: Value of LANGUAGE
+        lc_all: Value of LC_ALL
+        lc_messages: Value of LC_MESSAGES
+        lang: Value of LANG
+
+    Returns:
+        Detected language code, or 'en' as fallback
+    """
+    supported_codes = _get_supported_language_codes()
+
+    # LANGUAGE can have multiple values separated by ':'
+    for value in (*language.split(":"), lc_all, lc_messages, lang):
+        parsed = _parse_locale(value)
+        if parsed and parsed in supported_codes:
+            return parsed
 
     # Default fallback
     return "en"
@@ -10,9 +10,14 @@ Provides locale-specific formatting for:
 
 from __future__ import annotations
 
+import bisect
+from collections.abc import Callable, Iterable
 from datetime import datetime
+from types import MappingProxyType
 from typing import Any
 
+from cortex.i18n import translator as _translator_module
+
 # =============================================================================
 # Time Constants
 # =============================================================================
@@ -26,8 +31,34 @@ SECONDS_PER_WEEK = 604800  # 60 * 60 * 24 * 7
 SECONDS_PER_MONTH = 2592000  # 60 * 60 * 24 * 30 (approximate)
 SECONDS_PER_YEAR = 31536000  # 60 * 60 * 24 * 365 (approximate)
 
+# Relative-time buckets for format_time_ago. Anything below the first
+# threshold is "just now"; otherwise bisecting the thresholds selects the
+# (divisor, singular key, plural key) entry for the elapsed time.
+_TIME_AGO_THRESHOLDS = (
+    5,
+    SECONDS_PER_MINUTE,
+    SECONDS_PER_HOUR,
+    SECONDS_PER_DAY,
+    SECONDS_PER_WEEK,
+    SECONDS_PER_MONTH,
+    SECONDS_PER_YEAR,
+)
+_TIME_AGO_UNITS = (
+    (1, "second", "seconds"),
+    (SECONDS_PER_MINUTE, "minute", "minutes"),
+    (SECONDS_PER_HOUR, "hour", "hours"),
+    (SECONDS_PER_DAY, "day", "days"),
+    (SECONDS_PER_WEEK, "week", "weeks"),
+    (SECONDS_PER_MONTH, "month", "months"),
+    (SECONDS_PER_YEAR, "year", "years"),
+)
+
+# File size units shared by every locale that uses them
+_SI_UNITS = ("B", "KB", "MB", "GB", "TB")
+_FR_UNITS = ("o", "Ko", "Mo", "Go", "To")
+
 # Language-specific formatting configurations
-LOCALE_CONFIGS = {
+_LOCALE_CONFIGS: dict[str, dict[str, Any]] = {
     "en": {
         "date_format": "%Y-%m-%d",
         "time_format": "%I:%M %p",
@@ -52,7 +83,7 @@ LOCALE_CONFIGS = {
             "year": "1 year ago",
             "just_now": "just now",
         },
-        "file_size_units": ["B", "KB", "MB", "GB", "TB"],
+        "file_size_units": _SI_UNITS,
     },
     "es": {
         "date_format": "%d/%m/%Y",
@@ -78,7 +109,7 @@ LOCALE_CONFIGS = {
             "year": "hace 1 año",
             "just_now": "ahora mismo",
         },
-        "file_size_units": ["B", "KB", "MB", "GB", "TB"],
+        "file_size_units": _SI_UNITS,
     },
     "fr": {
         "date_format": "%d/%m/%Y",
@@ -104,7 +135,7 @@ LOCALE_CONFIGS = {
             "year": "il y a 1 an",
             "just_now": "à l'instant",
         },
-        "file_size_units": ["o", "Ko", "Mo", "Go", "To"],
+        "file_size_units": _FR_UNITS,
     },
     "de": {
         "date_format": "%d.%m.%Y",
@@ -130,7 +161,7 @@ LOCALE_CONFIGS = {
             "year": "vor 1 Jahr",
             "just_now": "gerade eben",
         },
-        "file_size_units": ["B", "KB", "MB", "GB", "TB"],
+        "file_size_units": _SI_UNITS,
     },
     "zh": {
         "date_format": "%Y年%m月%d日",
@@ -156,10 +187,90 @@ LOCALE_CONFIGS = {
             "year": "1年前",
             "just_now": "刚刚",
         },
-        "file_size_units": ["B", "KB", "MB", "GB", "TB"],
+        "file_size_units": _SI_UNITS,
     },
 }
 
+# Read-only public view of the locale configurations
+LOCALE_CONFIGS = MappingProxyType(_LOCALE_CONFIGS)
+
+
+# =============================================================================
+# Precompiled date/time formats
+# =============================================================================
+# strftime re-parses its format string on every call. The locale formats above
+# are fixed, so they are compiled once into a tuple of literal strings and
+# field emitters. Numeric directives are rendered straight from the datetime
+# fields; anything locale-dependent (month/weekday names, AM/PM) still goes
+# through strftime for that single directive.
+
+_FORMAT_KEYS = ("date_format", "time_format", "datetime_format", "datetime_full")
+
+_STRFTIME_FIELDS: dict[str, Callable[[datetime], str]] = {
+    "Y": lambda dt: str(dt.year),
+    "m": lambda dt: f"{dt.month:02d}",
+    "d": lambda dt: f"{dt.day:02d}",
+    "H": lambda dt: f"{dt.hour:02d}",
+    "I": lambda dt: f"{dt.hour % 12 or 12:02d}",
+    "M": lambda dt: f"{dt.minute:02d}",
+    "S": lambda dt: f"{dt.second:02d}",
+}
+
+CompiledFormat = tuple[str | Callable[[datetime], str], ...]
+
+
+def _strftime_directive(directive: str) -> Callable[[datetime], str]:
+    """Build an emitter that delegates a single directive to strftime."""
+    fmt = "%" + directive
+    return lambda dt: dt.strftime(fmt)
+
+
+def _compile_strftime(fmt: str) -> CompiledFormat:
+    """
+    Compile a strftime format string into literal strings and field emitters.
+
+    Args:
+        fmt: strftime-style format string
+
+    Returns:
+        Tuple of literal strings and callables taking a datetime
+    """
+    parts: list[str | Callable[[datetime], str]] = []
+    literal: list[str] = []
+    i = 0
+
+    while i < len(fmt):
+        char = fmt[i]
+        if char == "%" and i + 1 < len(fmt):
+            directive = fmt[i + 1]
+            i += 2
+            if directive == "%":
+                literal.append("%")
+                continue
+            if literal:
+                parts.append("".join(literal))
+                literal = []
+            parts.append(_STRFTIME_FIELDS.get(directive) or _strftime_directive(directive))
+        else:
+            literal.append(char)
+            i += 1
+
+    if literal:
+        parts.append("".join(literal))
+
+    return tuple(parts)
+
+
+def _render_format(compiled: CompiledFormat, dt: datetime) -> str:
+    """Render a precompiled format for a datetime."""
+    return "".join([part if isinstance(part, str) else part(dt) for part in compiled])
+
+
+_COMPILED_FORMATS: dict[str, dict[str, CompiledFormat]] = {
+    lang: {key: _compile_strftime(config[key]) for key in _FORMAT_KEYS}
+    for lang, config in LOCALE_CONFIGS.items()
+}
+
 
 class LocaleFormatter:
     """
@@ -168,6 +279,18 @@ class LocaleFormatter:
     Automatically uses the current language setting from the i18n module.
     """
 
+    __slots__ = (
+        "_language",
+        "_config",
+        "_formats",
+        "_decimal_sep",
+        "_thousands_sep",
+        "_units",
+        "_time_ago",
+        "_needs_sep_swap",
+        "_sep_table",
+    )
+
     def __init__(self, language: str = "en"):
         """
         Initialize the formatter with a language.
@@ -175,7 +298,33 @@ class LocaleFormatter:
         Args:
             language: Language code (defaults to English)
         """
-        self._language = language if language in LOCALE_CONFIGS else "en"
+        self._bind_language(language)
+
+    def _bind_language(self, language: str) -> None:
+        """
+        Resolve the locale configuration once and bind it to the instance.
+
+        Formatting methods read these attributes directly instead of looking
+        up LOCALE_CONFIGS on every call.
+
+        Args:
+            language: Language code; unsupported codes fall back to English
+        """
+        if language not in LOCALE_CONFIGS:
+            language = "en"
+
+        config = LOCALE_CONFIGS[language]
+        self._language = language
+        self._config = config
+        self._formats = _COMPILED_FORMATS[language]
+        self._decimal_sep: str = config["decimal_separator"]
+        self._thousands_sep: str = config["thousands_separator"]
+        self._units: tuple[str, ...] = config["file_size_units"]
+        self._time_ago: dict[str, str] = config["time_ago"]
+        self._needs_sep_swap = self._decimal_sep != "." or self._thousands_sep != ","
+        # Single-pass separator swap; translate() maps each character once, so
+        # no placeholder is needed when the two separators are exchanged.
+        self._sep_table = str.maketrans({",": self._thousands_sep, ".": self._decimal_sep})
 
     @property
     def language(self) -> str:
@@ -185,14 +334,7 @@ class LocaleFormatter:
     @language.setter
     def language(self, value: str) -> None:
         """Set the language."""
-        if value in LOCALE_CONFIGS:
-            self._language = value
-        else:
-            self._language = "en"
-
-    def _get_config(self) -> dict[str, Any]:
-        """Get the locale configuration for the current language."""
-        return LOCALE_CONFIGS.get(self._language, LOCALE_CONFIGS["en"])
+        self._bind_language(value)
 
     def format_date(self, dt: datetime) -> str:
         """
@@ -204,8 +346,7 @@ class LocaleFormatter:
         Returns:
             Formatted date string
         """
-        config = self._get_config()
-        return dt.strftime(config["date_format"])
+        return _render_format(self._formats["date_format"], dt)
 
     def format_time(self, dt: datetime) -> str:
         """
@@ -217,8 +358,7 @@ class LocaleFormatter:
         Returns:
             Formatted time string
         """
-        config = self._get_config()
-        return dt.strftime(config["time_format"])
+        return _render_format(self._formats["time_format"], dt)
 
     def format_datetime(self, dt: datetime, full: bool = False) -> str:
         """
@@ -231,9 +371,8 @@ class LocaleFormatter:
         Returns:
             Formatted datetime string
         """
-        config = self._get_config()
         format_key = "datetime_full" if full else "datetime_format"
-        return dt.strftime(config[format_key])
+        return _render_format(self._formats[format_key], dt)
 
     def format_number(self, number: int | float, decimals: int = 0) -> str:
         """
@@ -246,21 +385,14 @@ class LocaleFormatter:
         Returns:
             Formatted number string
         """
-        config = self._get_config()
-        decimal_sep = config["decimal_separator"]
-        thousands_sep = config["thousands_separator"]
-
         if decimals > 0:
-            formatted = f"{number:,.{decimals}f}"
+            formatted = format(number, f",.{decimals}f")
         else:
-            formatted = f"{int(number):,}"
+            formatted = format(int(number), ",")
 
         # Replace separators according to locale
-        if decimal_sep != "." or thousands_sep != ",":
-            # Use placeholder to avoid replacement conflicts
-            formatted = formatted.replace(",", "\x00")
-            formatted = formatted.replace(".", decimal_sep)
-            formatted = formatted.replace("\x00", thousands_sep)
+        if self._needs_sep_swap:
+            formatted = formatted.translate(self._sep_table)
 
         return formatted
 
@@ -274,18 +406,17 @@ class LocaleFormatter:
         Returns:
             Formatted file size (e.g., "1.5 GB")
         """
-        config = self._get_config()
-        units = config["file_size_units"]
+        units = self._units
 
         if size_bytes == 0:
             return f"0 {units[0]}"
 
-        size = float(size_bytes)
-        unit_index = 0
-
-        while size >= 1024 and unit_index < len(units) - 1:
-            size /= 1024
-            unit_index += 1
+        # Each unit is 2**10 larger, so the unit index is floor(log2(size) / 10)
+        if size_bytes >= 1024:
+            unit_index = min((int(size_bytes).bit_length() - 1) // 10, len(units) - 1)
+        else:
+            unit_index = 0
+        size = size_bytes / (1 << (unit_index * 10))
 
         # Format with appropriate decimals
         if size >= 100:
@@ -311,37 +442,40 @@ class LocaleFormatter:
         if now is None:
             now = datetime.now()
 
-        config = self._get_config()
-        time_ago = config["time_ago"]
+        time_ago = self._time_ago
 
         diff = now - dt
         seconds = int(diff.total_seconds())
 
-        if seconds < 0:
+        bucket = bisect.bisect_right(_TIME_AGO_THRESHOLDS, seconds)
+        if bucket == 0:
+            # Covers negative differences (future timestamps) as well
             return time_ago["just_now"]
 
-        if seconds < 5:
-            return time_ago["just_now"]
-        elif seconds < SECONDS_PER_MINUTE:
-            return time_ago["second"] if seconds == 1 else time_ago["seconds"].format(n=seconds)
-        elif seconds < SECONDS_PER_HOUR:
-            minutes = seconds // SECONDS_PER_MINUTE
-            return time_ago["minute"] if minutes == 1 else time_ago["minutes"].format(n=minutes)
-        elif seconds < SECONDS_PER_DAY:
-            hours = seconds // SECONDS_PER_HOUR
-            return time_ago["hour"] if hours == 1 else time_ago["hours"].format(n=hours)
-        elif seconds < SECONDS_PER_WEEK:
-            days = seconds // SECONDS_PER_DAY
-            return time_ago["day"] if days == 1 else time_ago["days"].format(n=days)
-        elif seconds < SECONDS_PER_MONTH:
-            weeks = seconds // SECONDS_PER_WEEK
-            return time_ago["week"] if weeks == 1 else time_ago["weeks"].format(n=weeks)
-        elif seconds < SECONDS_PER_YEAR:
-            months = seconds // SECONDS_PER_MONTH
-            return time_ago["month"] if months == 1 else time_ago["months"].format(n=months)
-        else:
-            years = seconds // SECONDS_PER_YEAR
-            return time_ago["year"] if years == 1 else time_ago["years"].format(n=years)
+        divisor, singular, plural = _TIME_AGO_UNITS[bucket - 1]
+        count = seconds // divisor
+        return time_ago[singular] if count == 1 else time_ago[plural].format(n=count)
+
+    def format_time_ago_bulk(
+        self, dts: Iterable[datetime], now: datetime | None = None
+    ) -> list[str]:
+        """
+        Format many datetimes as relative time strings.
+
+        The current time is captured once for the whole batch, so prefer
+        this over calling format_time_ago in a loop when rendering lists.
+
+        Args:
+            dts: datetimes to format
+            now: Current time (defaults to now)
+
+        Returns:
+            Relative time strings in the same order as dts
+        """
+        if now is None:
+            now = datetime.now()
+        format_time_ago = self.format_time_ago
+        return [format_time_ago(dt, now) for dt in dts]
 
     def format_duration(self, seconds: float) -> str:
         """
@@ -355,20 +489,24 @@ class LocaleFormatter:
         """
         if seconds < 1:
             return f"{seconds * 1000:.0f}ms"
-        elif seconds < SECONDS_PER_MINUTE:
+        if seconds < SECONDS_PER_MINUTE:
             return f"{seconds:.1f}s"
-        elif seconds < SECONDS_PER_HOUR:
-            minutes = int(seconds // SECONDS_PER_MINUTE)
-            secs = int(seconds % SECONDS_PER_MINUTE)
-            return f"{minutes}m {secs}s" if secs > 0 else f"{minutes}m"
-        else:
-            hours = int(seconds // SECONDS_PER_HOUR)
-            minutes = int((seconds % SECONDS_PER_HOUR) // SECONDS_PER_MINUTE)
-            return f"{hours}h {minutes}m" if minutes > 0 else f"{hours}h"
+
+        # Whole seconds from here on; split with integer divmod only
+        total = int(seconds)
+        if total < SECONDS_PER_HOUR:
+            minutes, secs = divmod(total, SECONDS_PER_MINUTE)
+            return f"{minutes}m {secs}s" if secs else f"{minutes}m"
+
+        hours, rem = divmod(total, SECONDS_PER_HOUR)
+        minutes = rem // SECONDS_PER_MINUTE
+        return f"{hours}h {minutes}m" if minutes else f"{hours}h"
 
 
 # Global formatter instance
 _formatter: LocaleFormatter | None = None
+# Translator language version the global formatter was last synced with
+_formatter_version = -1
 
 
 def get_formatter() -> LocaleFormatter:
@@ -376,23 +514,24 @@ def get_formatter() -> LocaleFormatter:
     Get or create the global formatter instance.
 
     The formatter is kept in sync with the current application language.
-    If the language has changed since the formatter was created, it will
-    be updated automatically.
+    The translator bumps a version counter on every language change, so the
+    current language is only looked up again when that counter has moved.
 
     Returns:
         The global LocaleFormatter instance
     """
-    global _formatter
-    from cortex.i18n.translator import get_language
-
-    current_language = get_language()
-
-    if _formatter is None:
-        # Create new formatter with current language
-        _formatter = LocaleFormatter(language=current_language)
-    elif _formatter.language != current_language:
-        # Language has changed - update the formatter
-        _formatter.language = current_language
+    global _formatter, _formatter_version
+
+    version = _translator_module._language_version
+    if _formatter is None or _formatter_version != version:
+        current_language = _translator_module.get_language()
+        if _formatter is None:
+            # Create new formatter with current language
+            _formatter = LocaleFormatter(language=current_language)
+        elif _formatter.language != current_language:
+            # Language has changed - update the formatter
+            _formatter.language = current_language
+        _formatter_version = version
 
     return _formatter
 
@@ -427,6 +566,11 @@ def format_time_ago(dt: datetime) -> str:
     return get_formatter().format_time_ago(dt)
 
 
+def format_time_ago_bulk(dts: Iterable[datetime]) -> list[str]:
+    """Format many relative times using the global formatter."""
+    return get_formatter().format_time_ago_bulk(dts)
+
+
 def format_duration(seconds: float) -> str:
     """Format a duration using the global formatter."""
     return get_formatter().format_duration(seconds)
@@ -8,12 +8,24 @@ Provides message translation with:
 - Debug mode for showing translation keys
 """
 
+import contextlib
+import functools
+import hashlib
+import marshal
 import os
+import string
+import sys
+import threading
+from collections.abc import Iterator, Mapping
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 import yaml
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 # Supported languages with their display names
 SUPPORTED_LANGUAGES: dict[str, dict[str, str]] = {
     "en": {"name": "English", "native": "English"},
@@ -25,13 +37,231 @@ SUPPORTED_LANGUAGES: dict[str, dict[str, str]] = {
 
 DEFAULT_LANGUAGE = "en"
 
+# Read-only language info, built once so lookups don't allocate
+_LANGUAGE_INFO: dict[str, Mapping[str, str]] = {
+    code: MappingProxyType({"code": code, "name": info["name"], "native": info["native"]})
+    for code, info in SUPPORTED_LANGUAGES.items()
+}
+_SUPPORTED_LANGUAGES_VIEW: Mapping[str, dict[str, str]] = MappingProxyType(SUPPORTED_LANGUAGES)
+
+# Bumped whenever a language changes so dependents (e.g. the global
+# LocaleFormatter) can detect staleness with a single integer comparison.
+_language_version = 0
+
+
+class _SafeDict(dict):
+    """Interpolation mapping that leaves unknown placeholders in place."""
+
+    def __missing__(self, key: str) -> str:
+        return "{" + key + "}"
+
+
+_FORMATTER = string.Formatter()
+
+# Interpolation values whose formatted text depends only on type and value
+_CACHEABLE_TYPES = frozenset({str, int, bool})
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_template(message: str) -> tuple[tuple[str, str | None], ...] | None:
+    """
+    Split a message into (literal, field_name) pairs for fast interpolation.
+
+    Args:
+        message: Message containing {variable} placeholders
+
+    Returns:
+        The parsed template, or None if it needs str.format_map (attribute or
+        index access, conversions, format specs, positional or malformed fields)
+    """
+    parts = []
+    try:
+        for literal, field, spec, conversion in _FORMATTER.parse(message):
+            if field is not None and (spec or conversion or not field.isidentifier()):
+                return None
+            parts.append((literal, field))
+    except ValueError:
+        return None
+    return tuple(parts)
+
+
+def _render(template: tuple[tuple[str, str | None], ...], kwargs: dict[str, Any]) -> str:
+    """
+    Render a compiled template, leaving unknown placeholders in place.
+
+    Args:
+        template: Template from _compile_template
+        kwargs: Variables to interpolate
+
+    Returns:
+        The interpolated message, identical to message.format_map(_SafeDict(kwargs))
+    """
+    out = []
+    for literal, field in template:
+        out.append(literal)
+        if field is not None:
+            out.append(format(kwargs[field]) if field in kwargs else "{" + field + "}")
+    return "".join(out)
+
+
+# Parsed catalogs and their flattened lookup tables, keyed by
+# (YAML path, (mtime_ns, size)) and shared by all translators
+_parsed_catalogs: dict[tuple[Path, tuple[int, int]], tuple[dict[str, Any], dict[str, str]]] = {}
+# Serializes cache misses so concurrent first lookups parse a catalog only once
+_parse_lock = threading.Lock()
+
+
+def _parse_catalog(
+    catalog_path: Path, source_key: tuple[int, int], cache_path: Path
+) -> tuple[dict[str, Any], dict[str, str]]:
+    """
+    Parse and flatten a YAML catalog, memoized per process.
+
+    Parsed catalogs are also cached in marshal format under ~/.cortex/i18n_cache
+    (when ~/.cortex exists) so later runs skip YAML parsing. Both caches are
+    keyed on the YAML file's path, mtime and size and are rebuilt whenever the
+    file changes. The returned dicts
+    are shared between translators and must not be modified.
+
+    Args:
+        catalog_path: Path to the YAML catalog
+        source_key: (mtime_ns, size) of the YAML catalog
+        cache_path: Path to the marshal cache file
+
+    Returns:
+        Tuple of the nested catalog (empty if it cannot be read) and the
+        same messages keyed by dotted path
+    """
+    memo_key = (catalog_path, source_key)
+    parsed = _parsed_catalogs.get(memo_key)
+    if parsed is not None:
+        return parsed
+
+    with _parse_lock:
+        parsed = _parsed_catalogs.get(memo_key)
+        if parsed is None:
+            catalog = _parse_catalog_file(catalog_path, source_key, cache_path)
+            parsed = (catalog, dict(_flatten(catalog)))
+            _parsed_catalogs[memo_key] = parsed
+    return parsed
+
+
+def _parse_catalog_file(
+    catalog_path: Path, source_key: tuple[int, int], cache_path: Path
+) -> dict[str, Any]:
+    """
+    Parse a YAML catalog through the on-disk marshal cache.
+
+    Args:
+        catalog_path: Path to the YAML catalog
+        source_key: (mtime_ns, size) of the YAML catalog
+        cache_path: Path to the marshal cache file
+
+    Returns:
+        The parsed catalog, or an empty dict if it cannot be read
+    """
+    catalog = _read_catalog_cache(cache_path, catalog_path, source_key)
+    if catalog is None:
+        try:
+            with open(catalog_path, encoding="utf-8") as f:
+                catalog = yaml.load(f, Loader=_YAML_LOADER) or {}
+        except (yaml.YAMLError, OSError):
+            # Log error but continue with empty catalog
+            return {}
+        _write_catalog_cache(cache_path, catalog_path, source_key, catalog)
+    return catalog
+
+
+def _flatten(data: dict[str, Any], prefix: str = "") -> Iterator[tuple[str, str]]:
+    """
+    Recursively yield (dotted_key, message) pairs from a nested catalog.
+
+    Args:
+        data: Dictionary to flatten
+        prefix: Current key prefix
+
+    Yields:
+        Tuples of dot-notation key and message string. Keys are interned so
+        lookups with literal keys from the code match by identity.
+    """
+    for key, value in data.items():
+        full_key = f"{prefix}.{key}" if prefix else f"{key}"
+        if isinstance(value, dict):
+            yield from _flatten(value, full_key)
+        elif value is not None:
+            yield sys.intern(full_key), str(value)
+
+
+def _read_catalog_cache(
+    cache_path: Path, catalog_path: Path, source_key: tuple[int, int]
+) -> dict[str, Any] | None:
+    """
+    Read a cached catalog if it matches the source file.
+
+    Args:
+        cache_path: Path to the marshal cache file
+        catalog_path: Path to the source YAML catalog
+        source_key: (mtime_ns, size) of the source YAML file
+
+    Returns:
+        The cached catalog, or None if missing, stale or unreadable
+    """
+    try:
+        with open(cache_path, "rb") as f:
+            cached_path, cached_key, catalog = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+    if (
+        cached_path != str(catalog_path)
+        or tuple(cached_key) != source_key
+        or not isinstance(catalog, dict)
+    ):
+        return None
+    return catalog
+
+
+def _write_catalog_cache(
+    cache_path: Path, catalog_path: Path, source_key: tuple[int, int], catalog: dict[str, Any]
+) -> None:
+    """
+    Write a parsed catalog to the cache (best effort).
+
+    Nothing is written unless the cache directory's parent (~/.cortex) already
+    exists, so read-only sessions never create it.
+
+    Args:
+        cache_path: Path to the marshal cache file
+        catalog_path: Path to the source YAML catalog
+        source_key: (mtime_ns, size) of the source YAML file
+        catalog: Parsed catalog to cache
+    """
+    try:
+        payload = marshal.dumps((str(catalog_path), source_key, catalog))
+    except ValueError:
+        # Not marshalable (e.g. a YAML date value); skip caching
+        return
+
+    if not cache_path.parent.parent.is_dir():
+        return
+
+    temp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(mode=0o700, exist_ok=True)
+        temp_path.write_bytes(payload)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        # Caching is an optimization only; a read-only home is fine
+        with contextlib.suppress(OSError):
+            temp_path.unlink(missing_ok=True)
+
 
 class Translator:
     """
     Handles message translation with catalog management.
 
     Features:
-    - Loads message catalogs from YAML files
+    - Loads message catalogs from YAML files on first use
     - Supports variable interpolation using {variable} syntax
     - Falls back to English if translation is missing
     - Supports debug mode to show translation keys
@@ -48,15 +278,16 @@ class Translator:
         self._language = language if language in SUPPORTED_LANGUAGES else DEFAULT_LANGUAGE
         self._debug = debug
         self._catalogs: dict[str, dict[str, Any]] = {}
+        # Catalogs flattened to {"install.success": "..."} for single-lookup translation
+        self._flat_catalogs: dict[str, dict[str, str]] = {}
+        # Per-instance LRU cache of interpolated messages, cleared on catalog reload
+        self._interpolate_cached = functools.lru_cache(maxsize=1024)(self._interpolate_items)
         self._locales_dir = Path(__file__).parent / "locales"
+        self._cache_dir = Path.home() / ".cortex" / "i18n_cache"
 
-        # Load English as fallback
+        # Load English as fallback; other catalogs load on first use
         self._load_catalog("en")
 
-        # Load requested language if different from English
-        if self._language != "en":
-            self._load_catalog(self._language)
-
     @property
     def language(self) -> str:
         """Get the current language code."""
@@ -78,9 +309,9 @@ class Translator:
                 f"Unsupported language: {value}. "
                 f"Supported: {', '.join(SUPPORTED_LANGUAGES.keys())}"
             )
+        global _language_version
         self._language = value
-        if value not in self._catalogs:
-            self._load_catalog(value)
+        _language_version += 1
 
     @property
     def debug(self) -> bool:
@@ -96,6 +327,9 @@ class Translator:
         """
         Load a message catalog from YAML file.
 
+        Parsing goes through _parse_catalog, so the same unchanged file is
+        only parsed once per process however many translators load it.
+
         Args:
             language: Language code to load
 
@@ -105,37 +339,32 @@ class Translator:
         """
         catalog_path = self._locales_dir / f"{language}.yaml"
 
-        if catalog_path.exists():
-            try:
-                with open(catalog_path, encoding="utf-8") as f:
-                    self._catalogs[language] = yaml.safe_load(f) or {}
-            except (yaml.YAMLError, OSError) as e:
-                # Log error but continue with empty catalog
-                self._catalogs[language] = {}
-        else:
-            self._catalogs[language] = {}
-
-    def _get_nested_value(self, data: dict[str, Any], key: str) -> str | None:
+        try:
+            source_stat = catalog_path.stat()
+        except OSError:
+            self._set_catalog(language, {}, {})
+            return
+
+        source_key = (source_stat.st_mtime_ns, source_stat.st_size)
+        # Separate installs (e.g. two virtualenvs) get separate cache files
+        path_tag = hashlib.blake2b(str(catalog_path).encode(), digest_size=6).hexdigest()
+        cache_path = (
+            self._cache_dir / f"{language}.{path_tag}.{sys.implementation.cache_tag}.marshal"
+        )
+        self._set_catalog(language, *_parse_catalog(catalog_path, source_key, cache_path))
+
+    def _set_catalog(self, language: str, catalog: dict[str, Any], flat: dict[str, str]) -> None:
         """
-        Get a nested value from a dictionary using dot notation.
+        Store a loaded catalog along with its flattened lookup table.
 
         Args:
-            data: Dictionary to search
-            key: Dot-separated key (e.g., 'install.success')
-
-        Returns:
-            The value if found, None otherwise
+            language: Language code of the catalog
+            catalog: Nested catalog as parsed from YAML
+            flat: The catalog's messages keyed by dotted path
         """
-        parts = key.split(".")
-        current = data
-
-        for part in parts:
-            if isinstance(current, dict) and part in current:
-                current = current[part]
-            else:
-                return None
-
-        return str(current) if current is not None else None
+        self._catalogs[language] = catalog
+        self._flat_catalogs[language] = flat
+        self._interpolate_cached.cache_clear()
 
     def translate(self, key: str, **kwargs: Any) -> str:
         """
@@ -159,28 +388,96 @@ class Translator:
         if self._debug:
             return f"[{key}]"
 
-        # Try current language first
-        message = self._get_nested_value(self._catalogs.get(self._language, {}), key)
+        message = self._lookup(self._language, key)
+        if message is None:
+            return key
+
+        # Nothing to interpolate: skip formatting (and the cache) entirely
+        if not kwargs or "{" not in message:
+            return message
+
+        # Repeated (key, kwargs) combinations are served from an LRU cache.
+        # Only exact str/int/bool values are cached: for those, equal values
+        # always format the same, and the cache never pins caller objects.
+        # Value types are part of the cache key so e.g. n=1 and n=True differ.
+        if all(type(value) in _CACHEABLE_TYPES for value in kwargs.values()):
+            items = tuple((name, type(value), value) for name, value in sorted(kwargs.items()))
+            return self._interpolate_cached(self._language, key, items)
+        return self._interpolate(self._language, key, kwargs)
+
+    def _lookup(self, language: str, key: str) -> str | None:
+        """
+        Look up a message, falling back to English.
+
+        Args:
+            language: Language code to look up first
+            key: Message key using dot notation
+
+        Returns:
+            The message if found, None otherwise
+        """
+        # Try requested language first
+        message = self._get_flat_catalog(language).get(key)
 
         # Fall back to English
-        if message is None and self._language != "en":
-            message = self._get_nested_value(self._catalogs.get("en", {}), key)
+        if message is None and language != "en":
+            message = self._get_flat_catalog("en").get(key)
+
+        return message
+
+    def _get_flat_catalog(self, language: str) -> dict[str, str]:
+        """
+        Get the flattened catalog for a language, loading it on first use.
+
+        Args:
+            language: Language code
+
+        Returns:
+            Flattened catalog mapping dotted keys to messages
+        """
+        flat = self._flat_catalogs.get(language)
+        if flat is None:
+            self._load_catalog(language)
+            flat = self._flat_catalogs[language]
+        return flat
+
+    def _interpolate(self, language: str, key: str, kwargs: dict[str, Any]) -> str:
+        """
+        Look up a message and interpolate variables into it.
+
+        Args:
+            language: Language code to translate into
+            key: Message key using dot notation
+            kwargs: Variables to interpolate into the message
+
+        Returns:
+            Translated message with variables replaced, or the key itself
+            if no translation is found.
+        """
+        message = self._lookup(language, key)
 
         # If still not found, return the key
         if message is None:
             return key
 
-        # Interpolate variables
-        if kwargs:
-            try:
-                message = message.format(**kwargs)
-            except (KeyError, IndexError, ValueError):
-                # If interpolation fails, return message without interpolation
-                # KeyError: missing named argument, IndexError: missing positional,
-                # ValueError: malformed format string
-                pass
-
-        return message
+        template = _compile_template(message)
+        if template is not None:
+            return _render(template, kwargs)
+
+        # Missing variables are left as {name} by _SafeDict rather than raising
+        try:
+            return message.format_map(_SafeDict(kwargs))
+        except (AttributeError, IndexError, ValueError):
+            # If interpolation fails, return message without interpolation
+            # AttributeError: field access on a missing variable,
+            # IndexError/ValueError: positional or malformed format string
+            return message
+
+    def _interpolate_items(
+        self, language: str, key: str, items: tuple[tuple[str, type, Any], ...]
+    ) -> str:
+        """Cacheable form of _interpolate taking (name, type, value) tuples."""
+        return self._interpolate(language, key, {name: value for name, _, value in items})
 
     def get_all_keys(self, language: str | None = None) -> set[str]:
         """
@@ -193,28 +490,33 @@ class Translator:
             Set of all translation keys
         """
         lang = language or self._language
-        catalog = self._catalogs.get(lang, {})
-        return self._extract_keys(catalog)
+        if lang not in self._catalogs:
+            self._load_catalog(lang)
+        return set(self._iter_keys(self._catalogs[lang]))
 
-    def _extract_keys(self, data: dict[str, Any], prefix: str = "") -> set[str]:
+    def _iter_keys(self, data: dict[str, Any], prefix: str = "") -> Iterator[str]:
         """
-        Recursively extract all keys from a nested dictionary.
+        Iteratively yield all keys from a nested dictionary.
+
+        Uses an explicit stack instead of recursion so no intermediate
+        sets are built per nesting level.
 
         Args:
             data: Dictionary to extract keys from
             prefix: Current key prefix
 
-        Returns:
-            Set of dot-notation keys
+        Yields:
+            Dot-notation keys
         """
-        keys = set()
-        for key, value in data.items():
-            full_key = f"{prefix}.{key}" if prefix else key
-            if isinstance(value, dict):
-                keys.update(self._extract_keys(value, full_key))
-            else:
-                keys.add(full_key)
-        return keys
+        stack = [(data, prefix)]
+        while stack:
+            current, current_prefix = stack.pop()
+            for key, value in current.items():
+                full_key = f"{current_prefix}.{key}" if current_prefix else f"{key}"
+                if isinstance(value, dict):
+                    stack.append((value, full_key))
+                else:
+                    yield full_key
 
     def get_missing_translations(self, language: str) -> set[str]:
         """
@@ -237,9 +539,8 @@ class Translator:
     def reload_catalogs(self) -> None:
         """Reload all message catalogs from disk."""
         self._catalogs.clear()
+        self._flat_catalogs.clear()
         self._load_catalog("en")
-        if self._language != "en":
-            self._load_catalog(self._language)
 
 
 # Global translator instance
@@ -312,35 +613,52 @@ def t(key: str, **kwargs: Any) -> str:
 
 
 def reset_translator() -> None:
-    """Reset the global translator (mainly for testing)."""
-    global _translator
+    """
+    Reset the global translator (mainly for testing).
+
+    Parsed catalogs are kept; use reset_translator_catalogs() to drop them too.
+    """
+    global _translator, _language_version
     _translator = None
+    _language_version += 1
+
+
+def reset_translator_catalogs() -> None:
+    """
+    Reset the global translator and drop all parsed catalogs (mainly for testing).
+
+    Only needed when catalog files change on disk without a change to their
+    mtime or size; otherwise changed files are reloaded automatically.
+    """
+    with _parse_lock:
+        _parsed_catalogs.clear()
+    _compile_template.cache_clear()
+    reset_translator()
 
 
-def get_language_info() -> dict[str, str]:
+def get_language_info() -> Mapping[str, str]:
     """
     Get information about the current language.
 
     Returns:
-        Dictionary with language details:
+        Read-only mapping with language details:
         - code: Language code (e.g., 'es')
         - name: English name (e.g., 'Spanish')
         - native: Native name (e.g., 'Español')
     """
     lang = get_language()
-    info = SUPPORTED_LANGUAGES.get(lang, SUPPORTED_LANGUAGES["en"])
-    return {
-        "code": lang,
-        "name": info["name"],
-        "native": info["native"],
-    }
+    info = _LANGUAGE_INFO.get(lang)
+    if info is None:
+        english = SUPPORTED_LANGUAGES["en"]
+        return {"code": lang, "name": english["name"], "native": english["native"]}
+    return info
 
 
-def get_supported_languages() -> dict[str, dict[str, str]]:
+def get_supported_languages() -> Mapping[str, dict[str, str]]:
     """
     Get all supported languages.
 
     Returns:
-        Dictionary mapping language codes to their info.
+        Read-only mapping of language codes to their info.
     """
-    return SUPPORTED_LANGUAGES.copy()
+    return _SUPPORTED_LANGUAGES_VIEW
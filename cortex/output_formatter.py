@@ -7,13 +7,16 @@ Provides investor-ready polished display for all CLI output.
 Issue: #242
 """
 
-from collections.abc import Generator
+import threading
+import time
+from collections.abc import Generator, Iterable, Sequence
 from contextlib import contextmanager
 from dataclasses import dataclass
 from enum import Enum
+from typing import Any
 
 from rich import box
-from rich.console import Console
+from rich.console import Console, RenderableType
 from rich.live import Live
 from rich.panel import Panel
 from rich.progress import (
@@ -27,8 +30,10 @@ from rich.progress import (
     TimeElapsedColumn,
     TimeRemainingColumn,
 )
+from rich.protocol import is_renderable
 from rich.status import Status
 from rich.table import Table
+from rich.text import Text
 from rich.tree import Tree
 
 console = Console()
@@ -72,6 +77,20 @@ class OutputStyle(Enum):
     MUTED = "muted"
 
 
+# Content colors for format_box and value colors for format_status_box;
+# status values use cyan rather than blue for INFO
+_CONTENT_STYLE_COLORS = {
+    OutputStyle.SUCCESS: "green",
+    OutputStyle.WARNING: "yellow",
+    OutputStyle.ERROR: "red",
+    OutputStyle.INFO: "blue",
+    OutputStyle.MUTED: "dim",
+    OutputStyle.DEFAULT: "white",
+}
+
+_STATUS_VALUE_COLORS = {**_CONTENT_STYLE_COLORS, OutputStyle.INFO: "cyan"}
+
+
 @dataclass
 class TableColumn:
     """Configuration for a table column."""
@@ -116,16 +135,7 @@ def format_box(
     Returns:
         Rich Panel object ready to print
     """
-    style_colors = {
-        OutputStyle.SUCCESS: "green",
-        OutputStyle.WARNING: "yellow",
-        OutputStyle.ERROR: "red",
-        OutputStyle.INFO: "blue",
-        OutputStyle.MUTED: "dim",
-        OutputStyle.DEFAULT: "white",
-    }
-
-    content_style = style_colors.get(style, "white")
+    content_style = _CONTENT_STYLE_COLORS.get(style, "white")
     styled_content = f"[{content_style}]{content}[/{content_style}]"
 
     return Panel(
@@ -163,28 +173,8 @@ def format_status_box(
     Returns:
         Rich Panel object
     """
-    style_colors = {
-        OutputStyle.SUCCESS: "green",
-        OutputStyle.WARNING: "yellow",
-        OutputStyle.ERROR: "red",
-        OutputStyle.INFO: "cyan",
-        OutputStyle.MUTED: "dim",
-        OutputStyle.DEFAULT: "white",
-    }
-
-    # Build content with aligned labels
-    max_label_len = max(len(item.label) for item in items) if items else 0
-    lines = []
-
-    for item in items:
-        color = style_colors.get(item.style, "white")
-        padded_label = item.label.ljust(max_label_len)
-        lines.append(f"  [dim]{padded_label}:[/dim]  [{color}]{item.value}[/{color}]")
-
-    content = "\n".join(lines)
-
     return Panel(
-        content,
+        _status_box_content(items),
         title=f"[bold cyan]{title}[/bold cyan]",
         border_style=border_style,
         padding=(1, 2),
@@ -192,9 +182,60 @@ def format_status_box(
     )
 
 
+def _status_box_content(items: list[StatusInfo]) -> Text:
+    """Build aligned status box rows as styled Text (labels and values are literal)."""
+    max_label_len = max(len(item.label) for item in items) if items else 0
+    lines = [
+        Text.assemble(
+            "  ",
+            (f"{item.label.ljust(max_label_len)}:", "dim"),
+            "  ",
+            (str(item.value), _STATUS_VALUE_COLORS.get(item.style, "white")),
+        )
+        for item in items
+    ]
+    return Text("\n").join(lines)
+
+
+class StatusBox:
+    """
+    Status box for displays that are refreshed repeatedly.
+
+    The panel (title, border, padding) is built once; each update only
+    rebuilds the key-value content inside it.
+
+    Example:
+        status_box = StatusBox("CORTEX ML SCHEDULER")
+        while running:
+            status_box.show([StatusInfo("Uptime", uptime())])
+    """
+
+    def __init__(self, title: str, border_style: str = "cyan"):
+        self._panel = format_status_box(title, [], border_style=border_style)
+
+    @property
+    def panel(self) -> Panel:
+        """The underlying Rich Panel."""
+        return self._panel
+
+    def update(self, items: list[StatusInfo]) -> Panel:
+        """Replace the box content and return the panel."""
+        self._panel.renderable = _status_box_content(items)
+        return self._panel
+
+    def show(self, items: list[StatusInfo]) -> None:
+        """Replace the box content and print the box."""
+        console.print(self.update(items))
+
+
+def _as_cell(value: Any) -> RenderableType:
+    """Return a table cell, converting non-renderable values (e.g. numbers) with str()."""
+    return value if is_renderable(value) else str(value)
+
+
 def format_table(
-    columns: list[TableColumn],
-    rows: list[list[str]],
+    columns: Sequence[TableColumn],
+    rows: Iterable[Sequence[Any]],
     title: str | None = None,
     show_header: bool = True,
     show_lines: bool = False,
@@ -235,11 +276,19 @@ def format_table(
 
     for i, row in enumerate(rows):
         style = row_styles[i] if row_styles and i < len(row_styles) else None
-        table.add_row(*row, style=style)
+        table.add_row(*map(_as_cell, row), style=style)
 
     return table
 
 
+# Column schema shared by every package table
+_PACKAGE_TABLE_COLUMNS = (
+    TableColumn("Package", style="cyan", no_wrap=True),
+    TableColumn("Version", style="white"),
+    TableColumn("Action", style="green"),
+)
+
+
 def format_package_table(
     packages: list[tuple[str, str, str]],
     title: str = "Packages",
@@ -254,14 +303,8 @@ def format_package_table(
     Returns:
         Rich Table object
     """
-    columns = [
-        TableColumn("Package", style="cyan", no_wrap=True),
-        TableColumn("Version", style="white"),
-        TableColumn("Action", style="green"),
-    ]
-
     rows = [[pkg[0], pkg[1], pkg[2]] for pkg in packages]
-    return format_table(columns, rows, title=title)
+    return format_table(_PACKAGE_TABLE_COLUMNS, rows, title=title)
 
 
 def format_dependency_tree(
@@ -300,13 +343,81 @@ def format_dependency_tree(
     return tree
 
 
+# Minimum seconds between spinner message repaints
+SPINNER_UPDATE_INTERVAL = 0.1
+
+
+class _ThrottledStatus:
+    """
+    Proxy for a Rich Status that coalesces rapid message updates.
+
+    Message updates arriving within SPINNER_UPDATE_INTERVAL of the last one
+    that was forwarded are held back; the latest held message is shown once
+    the interval has passed, on the next forwarded update, or on flush().
+    Other attributes are delegated to the wrapped Status.
+    """
+
+    def __init__(self, status: Status, interval: float = SPINNER_UPDATE_INTERVAL):
+        self._status = status
+        self._interval = interval
+        self._last_update = float("-inf")
+        self._pending: RenderableType | None = None
+        self._timer: threading.Timer | None = None
+        self._lock = threading.Lock()
+
+    def update(self, status: RenderableType | None = None, **kwargs: Any) -> None:
+        """Update the spinner, forwarding at most once per interval."""
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._last_update
+            if not kwargs and elapsed < self._interval:
+                if status is not None:
+                    self._pending = status
+                    if self._timer is None:
+                        # Trailing edge: show the held message once the interval is up
+                        self._timer = threading.Timer(self._interval - elapsed, self.flush)
+                        self._timer.daemon = True
+                        self._timer.start()
+                return
+
+            if status is None:
+                status = self._pending
+            self._forward(status, now, **kwargs)
+
+    def flush(self) -> None:
+        """Show any held message immediately."""
+        with self._lock:
+            if self._pending is not None:
+                self._forward(self._pending, time.monotonic())
+            elif self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+    def _forward(self, status: RenderableType | None, now: float, **kwargs: Any) -> None:
+        """Pass an update to the wrapped Status. Caller holds the lock."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._pending = None
+        self._last_update = now
+        self._status.update(status, **kwargs)
+
+    def stop(self) -> None:
+        """Show any held message and stop the spinner."""
+        self.flush()
+        self._status.stop()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._status, name)
+
+
 @contextmanager
 def spinner_context(
     message: str,
     success_message: str | None = None,
     error_message: str | None = None,
     spinner_type: str = "dots",
-) -> Generator[Status, None, None]:
+) -> Generator[_ThrottledStatus, None, None]:
     """
     Context manager for showing a spinner during long operations.
 
@@ -317,7 +428,7 @@ def spinner_context(
         spinner_type: Type of spinner animation
 
     Yields:
-        Rich Status object for updating message
+        Status proxy for updating the message; rapid updates are throttled
 
     Example:
         with spinner_context("Loading...", "Done!") as status:
@@ -325,8 +436,12 @@ def spinner_context(
             status.update("Still working...")
     """
     with console.status(f"[cyan]{message}[/cyan]", spinner=spinner_type) as status:
+        throttled = _ThrottledStatus(status)
         try:
-            yield status
+            try:
+                yield throttled
+            finally:
+                throttled.flush()
             if success_message:
                 console.print(f"[green]{STATUS_ICONS['success']}[/green] {success_message}")
         except Exception:
@@ -335,6 +450,18 @@ def spinner_context(
             raise
 
 
+# Stateless progress columns shared by every ProgressTracker. SpinnerColumn
+# (animation start time) and TimeRemainingColumn (per-task render cache) keep
+# state, so those are still created per tracker.
+_PROGRESS_COLUMNS = (
+    TextColumn("[bold cyan]{task.description}[/bold cyan]"),
+    BarColumn(bar_width=40, style="cyan", complete_style="green"),
+    TaskProgressColumn(),
+    MofNCompleteColumn(),
+    TimeElapsedColumn(),
+)
+
+
 class ProgressTracker:
     """
     Progress bar tracker for multi-step operations.
@@ -360,14 +487,7 @@ class ProgressTracker:
         self._task_id: TaskID | None = None
 
     def __enter__(self) -> "ProgressTracker":
-        columns = [
-            SpinnerColumn(),
-            TextColumn("[bold cyan]{task.description}[/bold cyan]"),
-            BarColumn(bar_width=40, style="cyan", complete_style="green"),
-            TaskProgressColumn(),
-            MofNCompleteColumn(),
-            TimeElapsedColumn(),
-        ]
+        columns = [SpinnerColumn(), *_PROGRESS_COLUMNS]
 
         if self.total is not None:
             columns.append(TimeRemainingColumn())
@@ -530,6 +650,40 @@ def print_table(columns: list[TableColumn], rows: list[list[str]], **kwargs):
     console.print(format_table(columns, rows, **kwargs))
 
 
+def print_table_stream(
+    columns: Sequence[TableColumn],
+    rows: Iterable[Sequence[Any]],
+    refresh_every: int | None = None,
+    **kwargs,
+):
+    """
+    Print a table whose rows are produced incrementally.
+
+    The table is built once and rows are appended as the iterable yields
+    them, so callers can pass a generator instead of collecting every row
+    first. The table is printed once at the end.
+
+    Args:
+        columns: List of TableColumn configurations
+        rows: Iterable of rows; non-renderable cells are converted with str()
+        refresh_every: If set, show the table live and repaint every N rows
+        **kwargs: Additional format_table options (title, show_header, show_lines)
+    """
+    table = format_table(columns, [], **kwargs)
+
+    if not refresh_every:
+        for row in rows:
+            table.add_row(*map(_as_cell, row))
+        console.print(table)
+        return
+
+    with Live(table, console=console, auto_refresh=False) as live:
+        for count, row in enumerate(rows, 1):
+            table.add_row(*map(_as_cell, row))
+            if count % refresh_every == 0:
+                live.refresh()
+
+
 def print_divider(title: str | None = None, style: str = "cyan"):
     """Print a horizontal divider with optional title."""
     if title:
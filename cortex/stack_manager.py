@@ -7,6 +7,7 @@ Usage:
   cortex stack webdev --dry-run    # Preview webdev stack
 """
 
+import functools
 import json
 import threading
 from pathlib import Path
@@ -15,6 +16,17 @@ from typing import Any
 from cortex.hardware_detection import has_nvidia_gpu
 
 
+@functools.lru_cache(maxsize=1)
+def _has_nvidia_gpu_cached() -> bool:
+    """Detect an NVIDIA GPU once per process; hardware doesn't change at runtime."""
+    return has_nvidia_gpu()
+
+
+def reset_gpu_cache() -> None:
+    """Forget the cached GPU detection result (mainly for testing)."""
+    _has_nvidia_gpu_cached.cache_clear()
+
+
 class StackManager:
     """Manages pre-built package stacks with hardware awareness"""
 
@@ -22,6 +34,7 @@ class StackManager:
         # stacks.json is in the same directory as this file (cortex/)
         self.stacks_file = Path(__file__).parent / "stacks.json"
         self._stacks = None
+        self._stacks_by_id: dict[str, dict[str, Any]] = {}
         self._stacks_lock = threading.Lock()  # Protect _stacks cache
 
     def load_stacks(self) -> dict[str, Any]:
@@ -37,7 +50,19 @@ class StackManager:
 
             try:
                 with open(self.stacks_file) as f:
-                    self._stacks = json.load(f)
+                    stacks = json.load(f)
+                # Build the id index before publishing _stacks so lock-free
+                # readers never see a loaded cache without its index.
+                # setdefault keeps the first stack when ids are duplicated;
+                # entries without an id can't be looked up and are skipped.
+                stacks_by_id: dict[str, dict[str, Any]] = {}
+                for stack in stacks.get("stacks", []):
+                    stack_id = stack.get("id")
+                    if stack_id is None:
+                        continue
+                    stacks_by_id.setdefault(stack_id, stack)
+                self._stacks_by_id = stacks_by_id
+                self._stacks = stacks
                 return self._stacks
             except FileNotFoundError as e:
                 raise FileNotFoundError(f"Stacks config not found at {self.stacks_file}") from e
@@ -51,10 +76,8 @@ class StackManager:
 
     def find_stack(self, stack_id: str) -> dict[str, Any] | None:
         """Find a stack by ID"""
-        for stack in self.list_stacks():
-            if stack["id"] == stack_id:
-                return stack
-        return None
+        self.load_stacks()
+        return self._stacks_by_id.get(stack_id)
 
     def get_stack_packages(self, stack_id: str) -> list[str]:
         """Get package list for a stack"""
@@ -74,7 +97,7 @@ class StackManager:
         The suggested stack identifier (may differ from input).
         """
         if base_stack == "ml":
-            return "ml" if has_nvidia_gpu() else "ml-cpu"
+            return "ml" if _has_nvidia_gpu_cached() else "ml-cpu"
         return base_stack
 
     def describe_stack(self, stack_id: str) -> str:
@@ -93,18 +116,20 @@ class StackManager:
         if not stack:
             return f"Stack '{stack_id}' not found"
 
-        output = f"\n📦 Stack: {stack['name']}\n"
-        output += f"Description: {stack['description']}\n\n"
-        output += "Packages included:\n"
+        parts = [
+            f"\n📦 Stack: {stack['name']}\n",
+            f"Description: {stack['description']}\n\n",
+            "Packages included:\n",
+        ]
 
         for idx, pkg in enumerate(stack.get("packages", []), 1):
-            output += f"  {idx}. {pkg}\n"
+            parts.append(f"  {idx}. {pkg}\n")
 
         tags = stack.get("tags", [])
         if tags:
-            output += f"\nTags:  {', '.join(tags)}\n"
+            parts.append(f"\nTags:  {', '.join(tags)}\n")
 
         hardware = stack.get("hardware", "any")
-        output += f"Hardware: {hardware}\n"
+        parts.append(f"Hardware: {hardware}\n")
 
-        return output
+        return "".join(parts)
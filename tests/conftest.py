@@ -1,8 +1,3 @@
-from __future__ import annotations
-
-import sys
-from pathlib import Path
-
 """Pytest configuration.
 
 Some tests in this repository import implementation modules as if they were top-level
@@ -13,6 +8,14 @@ Insert `cortex/` into `sys.path` early (at conftest import time) so imports reso
 during test collection.
 """
 
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+from rich.console import Console
+
 repo_root = Path(__file__).resolve().parents[1]
 
 # Support both layouts used across branches/history:
@@ -22,3 +25,18 @@ for path in (repo_root / "src", repo_root / "cortex"):
     path_str = str(path)
     if path.exists() and path_str not in sys.path:
         sys.path.insert(0, path_str)
+
+
+@pytest.fixture
+def plain_console(monkeypatch):
+    """
+    Route Cortex console output through an uncoloured, non-terminal Console.
+
+    The console is created without a file so it writes to whatever
+    sys.stdout is at print time, which keeps capsys capture working.
+    """
+    plain = Console(no_color=True, force_terminal=False, width=200)
+    monkeypatch.setattr("cortex.branding.console", plain)
+    monkeypatch.setattr("cortex.gpu_manager.console", plain)
+    return plain
+
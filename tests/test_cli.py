@@ -230,6 +230,13 @@ class TestCortexCLI(unittest.TestCase):
         self.assertEqual(result, 0)
         mock_install.assert_called_once_with("docker", execute=False, dry_run=True, parallel=False)
 
+    @patch("cortex.cli.console")
+    def test_stack_dry_run_lists_packages_in_one_print(self, mock_console):
+        packages = ["numpy", "pandas", "scipy"]
+        result = self.cli._handle_stack_dry_run({"name": "ML"}, packages)
+        self.assertEqual(result, 0)
+        mock_console.print.assert_any_call("  • numpy\n  • pandas\n  • scipy")
+
     def test_spinner_animation(self):
         initial_idx = self.cli.spinner_idx
         self.cli._animate_spinner("Testing")
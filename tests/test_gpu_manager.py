@@ -4,9 +4,11 @@ Tests for GPU Manager Module
 Issue: #454 - Hybrid GPU (Optimus) Manager
 """
 
+import io
 from unittest.mock import MagicMock, patch
 
 import pytest
+from rich.console import Console
 
 from cortex.gpu_manager import (
     APP_GPU_RECOMMENDATIONS,
@@ -19,27 +21,50 @@ from cortex.gpu_manager import (
     run_gpu_manager,
 )
 
+pytestmark = pytest.mark.usefixtures("plain_console")
+
+
+@pytest.fixture(scope="module")
+def shared_manager():
+    """Create one manager instance for the whole module."""
+    return HybridGPUManager(verbose=False)
+
+
+@pytest.fixture
+def manager(shared_manager):
+    """Provide the shared manager with its cached GPU state cleared."""
+    shared_manager._state = None
+    return shared_manager
+
 
 class TestGPUMode:
     """Tests for GPUMode enum."""
 
-    def test_gpu_modes(self):
+    @pytest.mark.parametrize(
+        "mode,value",
+        [
+            (GPUMode.INTEGRATED, "integrated"),
+            (GPUMode.HYBRID, "hybrid"),
+            (GPUMode.NVIDIA, "nvidia"),
+            (GPUMode.COMPUTE, "compute"),
+            (GPUMode.UNKNOWN, "unknown"),
+        ],
+    )
+    def test_gpu_modes(self, mode, value):
         """Test all GPU modes are defined."""
-        assert GPUMode.INTEGRATED.value == "integrated"
-        assert GPUMode.HYBRID.value == "hybrid"
-        assert GPUMode.NVIDIA.value == "nvidia"
-        assert GPUMode.COMPUTE.value == "compute"
-        assert GPUMode.UNKNOWN.value == "unknown"
+        assert mode.value == value
 
 
 class TestGPUVendor:
     """Tests for GPUVendor enum."""
 
-    def test_gpu_vendors(self):
+    @pytest.mark.parametrize(
+        "vendor,value",
+        [(GPUVendor.INTEL, "intel"), (GPUVendor.AMD, "amd"), (GPUVendor.NVIDIA, "nvidia")],
+    )
+    def test_gpu_vendors(self, vendor, value):
         """Test all GPU vendors are defined."""
-        assert GPUVendor.INTEL.value == "intel"
-        assert GPUVendor.AMD.value == "amd"
-        assert GPUVendor.NVIDIA.value == "nvidia"
+        assert vendor.value == value
 
 
 class TestGPUDevice:
@@ -139,15 +164,17 @@ class TestAppGPURecommendations:
         assert APP_GPU_RECOMMENDATIONS.get("code") == GPUVendor.INTEL
         assert APP_GPU_RECOMMENDATIONS.get("firefox") == GPUVendor.INTEL
 
+    def test_lookup_tables_read_only(self):
+        """Test module-level lookup tables cannot be modified."""
+        with pytest.raises(TypeError):
+            APP_GPU_RECOMMENDATIONS["steam"] = GPUVendor.INTEL
+        with pytest.raises(TypeError):
+            BATTERY_IMPACT[GPUMode.UNKNOWN] = {}
+
 
 class TestHybridGPUManager:
     """Tests for HybridGPUManager class."""
 
-    @pytest.fixture
-    def manager(self):
-        """Create a manager instance."""
-        return HybridGPUManager(verbose=False)
-
     def test_initialization(self, manager):
         """Test manager initialization."""
         assert manager.verbose is False
@@ -173,10 +200,6 @@ class TestHybridGPUManager:
 class TestDetectGPUs:
     """Tests for GPU detection."""
 
-    @pytest.fixture
-    def manager(self):
-        return HybridGPUManager()
-
     def test_detect_gpus_parses_lspci(self, manager):
         """Test lspci output parsing."""
         lspci_output = """00:02.0 VGA compatible controller [0300]: Intel Corporation Device 9a49 (rev 03)
@@ -215,80 +238,54 @@ class TestDetectGPUs:
 class TestDetectMode:
     """Tests for GPU mode detection."""
 
-    @pytest.fixture
-    def manager(self):
-        return HybridGPUManager()
-
-    def test_detect_mode_prime_nvidia(self, manager):
-        """Test detecting NVIDIA mode via prime-select."""
-        with patch.object(manager, "_run_command") as mock_cmd:
-            mock_cmd.return_value = (0, "nvidia", "")
-            mode = manager.detect_mode()
-            assert mode == GPUMode.NVIDIA
-
-    def test_detect_mode_prime_ondemand(self, manager):
-        """Test detecting hybrid mode via prime-select."""
-        with patch.object(manager, "_run_command") as mock_cmd:
-            mock_cmd.return_value = (0, "on-demand", "")
-            mode = manager.detect_mode()
-            assert mode == GPUMode.HYBRID
-
-    def test_detect_mode_prime_intel(self, manager):
-        """Test detecting integrated mode via prime-select."""
-        with patch.object(manager, "_run_command") as mock_cmd:
-            mock_cmd.return_value = (0, "intel", "")
-            mode = manager.detect_mode()
-            assert mode == GPUMode.INTEGRATED
-
-    def test_detect_mode_unknown(self, manager):
-        """Test unknown mode when no tool available."""
-        with patch.object(manager, "_run_command") as mock_cmd:
-            mock_cmd.return_value = (1, "", "not found")
-            mode = manager.detect_mode()
-            assert mode == GPUMode.UNKNOWN
+    @pytest.mark.parametrize(
+        "command_result,expected",
+        [
+            ((0, "nvidia", ""), GPUMode.NVIDIA),
+            ((0, "on-demand", ""), GPUMode.HYBRID),
+            ((0, "intel", ""), GPUMode.INTEGRATED),
+            # No tool available
+            ((1, "", "not found"), GPUMode.UNKNOWN),
+        ],
+        ids=["prime_nvidia", "prime_ondemand", "prime_intel", "unknown"],
+    )
+    def test_detect_mode(self, manager, command_result, expected):
+        """Test detecting the GPU mode via prime-select."""
+        with patch.object(manager, "_run_command", return_value=command_result):
+            assert manager.detect_mode() == expected
 
 
 class TestGetState:
     """Tests for get_state method."""
 
-    @pytest.fixture
-    def manager(self):
-        return HybridGPUManager()
-
     def test_get_state_caches_result(self, manager):
         """Test that state is cached."""
-        with patch.object(manager, "detect_gpus") as mock_gpus:
-            with patch.object(manager, "detect_mode") as mock_mode:
-                mock_gpus.return_value = []
-                mock_mode.return_value = GPUMode.UNKNOWN
-
-                state1 = manager.get_state()
-                state2 = manager.get_state()
+        mock_gpus = MagicMock(return_value=[])
+        with patch.multiple(
+            manager, detect_gpus=mock_gpus, detect_mode=MagicMock(return_value=GPUMode.UNKNOWN)
+        ):
+            state1 = manager.get_state()
+            state2 = manager.get_state()
 
-                # Should only call detect once
-                assert mock_gpus.call_count == 1
+            # Should only call detect once
+            assert mock_gpus.call_count == 1
 
     def test_get_state_refresh(self, manager):
         """Test state refresh."""
-        with patch.object(manager, "detect_gpus") as mock_gpus:
-            with patch.object(manager, "detect_mode") as mock_mode:
-                mock_gpus.return_value = []
-                mock_mode.return_value = GPUMode.UNKNOWN
+        mock_gpus = MagicMock(return_value=[])
+        with patch.multiple(
+            manager, detect_gpus=mock_gpus, detect_mode=MagicMock(return_value=GPUMode.UNKNOWN)
+        ):
+            manager.get_state()
+            manager.get_state(refresh=True)
 
-                manager.get_state()
-                manager.get_state(refresh=True)
-
-                # Should call detect twice due to refresh
-                assert mock_gpus.call_count == 2
+            # Should call detect twice due to refresh
+            assert mock_gpus.call_count == 2
 
 
 class TestSwitchMode:
     """Tests for mode switching."""
 
-    @pytest.fixture
-    def manager(self):
-        return HybridGPUManager()
-
     def test_switch_mode_non_hybrid(self, manager):
         """Test switching on non-hybrid system."""
         state = GPUState(devices=[GPUDevice(vendor=GPUVendor.INTEL, name="Intel")])
@@ -308,26 +305,22 @@ class TestSwitchMode:
             ]
         )
 
-        with patch.object(manager, "get_state") as mock_state:
-            mock_state.return_value = state
-            with patch.object(manager, "_run_command") as mock_cmd:
-                # which prime-select succeeds
-                mock_cmd.return_value = (0, "/usr/bin/prime-select", "")
-
-                success, message, command = manager.switch_mode(GPUMode.NVIDIA)
+        # which prime-select succeeds
+        with patch.multiple(
+            manager,
+            get_state=MagicMock(return_value=state),
+            _run_command=MagicMock(return_value=(0, "/usr/bin/prime-select", "")),
+        ):
+            success, message, command = manager.switch_mode(GPUMode.NVIDIA)
 
-                assert success
-                assert command is not None
-                assert "prime-select nvidia" in command
+            assert success
+            assert command is not None
+            assert "prime-select nvidia" in command
 
 
 class TestGetAppLaunchCommand:
     """Tests for app launch command generation."""
 
-    @pytest.fixture
-    def manager(self):
-        return HybridGPUManager()
-
     def test_launch_with_nvidia(self, manager):
         """Test launch command with NVIDIA GPU."""
         state = GPUState(
@@ -383,28 +376,19 @@ class TestGetAppLaunchCommand:
 class TestGetBatteryEstimate:
     """Tests for battery estimate."""
 
-    @pytest.fixture
-    def manager(self):
-        return HybridGPUManager()
-
-    def test_battery_estimate_integrated(self, manager):
-        """Test integrated mode estimate."""
-        estimate = manager.get_battery_estimate(GPUMode.INTEGRATED)
-        assert "best" in estimate["description"].lower()
-
-    def test_battery_estimate_nvidia(self, manager):
-        """Test NVIDIA mode estimate."""
-        estimate = manager.get_battery_estimate(GPUMode.NVIDIA)
-        assert "performance" in estimate["description"].lower()
+    @pytest.mark.parametrize(
+        "mode,keyword",
+        [(GPUMode.INTEGRATED, "best"), (GPUMode.NVIDIA, "performance")],
+    )
+    def test_battery_estimate(self, manager, mode, keyword):
+        """Test mode battery estimates."""
+        estimate = manager.get_battery_estimate(mode)
+        assert keyword in estimate["description"].lower()
 
 
 class TestDisplayMethods:
     """Tests for display methods."""
 
-    @pytest.fixture
-    def manager(self):
-        return HybridGPUManager()
-
     def test_display_status(self, manager, capsys):
         """Test display_status runs without error."""
         state = GPUState(
@@ -446,42 +430,94 @@ class TestDisplayMethods:
 
             assert "steam" in captured.out.lower() or "blender" in captured.out.lower()
 
+    def test_display_modes_plain_when_not_terminal(self, manager, capsys):
+        """Test tables are printed as plain aligned text when output is piped."""
+        manager.display_modes()
+        captured = capsys.readouterr()
+
+        assert "INTEGRATED  Uses Intel/AMD only" in captured.out
+        assert "╭" not in captured.out
+
+    def test_display_modes_table_on_terminal(self, manager):
+        """Test tables are rendered with Rich when output is a terminal."""
+        terminal = Console(file=io.StringIO(), force_terminal=True, width=120)
+        with patch("cortex.gpu_manager.console", terminal):
+            manager.display_modes()
+
+        assert "╭" in terminal.file.getvalue()
+
+    def test_display_all_matches_separate_displays(self, manager, capsys):
+        """Test display_all prints the same output as the three display methods."""
+        state = GPUState(
+            mode=GPUMode.HYBRID,
+            devices=[
+                GPUDevice(vendor=GPUVendor.INTEL, name="Intel HD 630"),
+                GPUDevice(vendor=GPUVendor.NVIDIA, name="GTX 1080", memory_mb=8192),
+            ],
+        )
+
+        with patch.object(manager, "get_state", return_value=state):
+            manager.display_status()
+            manager.display_modes()
+            manager.display_app_recommendations()
+            separate = capsys.readouterr().out
+
+            with patch("cortex.gpu_manager.console.print") as mock_print:
+                manager.display_all()
+            assert mock_print.call_count == 1
+
+            manager.display_all()
+            combined = capsys.readouterr().out
+
+        assert combined == separate
+        assert "Available GPU Modes" in combined
+
 
 class TestRunGPUManager:
     """Tests for run_gpu_manager entry point."""
 
-    def test_run_status(self, capsys):
-        """Test running status action."""
-        with patch("cortex.gpu_manager.HybridGPUManager") as MockManager:
-            mock_instance = MagicMock()
-            MockManager.return_value = mock_instance
+    @pytest.fixture(scope="class")
+    def shared_mock_manager(self):
+        """Create one manager mock for the whole class."""
+        return MagicMock()
 
-            result = run_gpu_manager("status")
+    @pytest.fixture
+    def mock_manager(self, monkeypatch, shared_mock_manager):
+        """Make run_gpu_manager construct the shared mock, with calls reset."""
+        shared_mock_manager.reset_mock()
+        monkeypatch.setattr(
+            "cortex.gpu_manager.HybridGPUManager", lambda verbose=False: shared_mock_manager
+        )
+        return shared_mock_manager
 
-            mock_instance.display_status.assert_called_once()
-            assert result == 0
+    def test_run_status(self, mock_manager):
+        """Test running status action."""
+        result = run_gpu_manager("status")
 
-    def test_run_modes(self, capsys):
-        """Test running modes action."""
-        with patch("cortex.gpu_manager.HybridGPUManager") as MockManager:
-            mock_instance = MagicMock()
-            MockManager.return_value = mock_instance
+        mock_manager.display_status.assert_called_once()
+        assert result == 0
 
-            result = run_gpu_manager("modes")
+    def test_run_modes(self, mock_manager):
+        """Test running modes action."""
+        result = run_gpu_manager("modes")
 
-            mock_instance.display_modes.assert_called_once()
-            assert result == 0
+        mock_manager.display_modes.assert_called_once()
+        assert result == 0
 
-    def test_run_apps(self):
+    def test_run_apps(self, mock_manager):
         """Test running apps action."""
-        with patch("cortex.gpu_manager.HybridGPUManager") as MockManager:
-            mock_instance = MagicMock()
-            MockManager.return_value = mock_instance
+        result = run_gpu_manager("apps")
+
+        mock_manager.display_app_recommendations.assert_called_once()
+        assert result == 0
 
-            result = run_gpu_manager("apps")
+    def test_run_all(self, mock_manager):
+        """Test running all action prints every section at once."""
+        result = run_gpu_manager("all")
 
-            mock_instance.display_app_recommendations.assert_called_once()
-            assert result == 0
+        mock_manager.display_all.assert_called_once()
+        mock_manager.display_status.assert_not_called()
+        assert result == 0
 
     def test_run_switch_no_mode(self, capsys):
         """Test switch without mode."""
@@ -10,42 +10,111 @@ Tests cover:
 - Configuration persistence
 """
 
+import argparse
+import importlib.resources
 import os
+import sys
 import tempfile
+import threading
 import unittest
+from contextlib import contextmanager
 from datetime import datetime, timedelta
+from decimal import Decimal
 from pathlib import Path
 from unittest.mock import patch
 
+import cortex.i18n.translator as translator_module
+from cortex.cli import CortexCLI, _handle_set_language, _resolve_language_name
+from cortex.i18n import get_language, get_language_info, get_supported_languages, set_language, t
+from cortex.i18n.config import LanguageConfig
+from cortex.i18n.detector import _detect, detect_os_language, get_os_locale_info
+from cortex.i18n.formatter import (
+    LOCALE_CONFIGS,
+    LocaleFormatter,
+    format_date,
+    format_datetime,
+    format_duration,
+    format_file_size,
+    format_number,
+    format_time,
+)
+from cortex.i18n.translator import (
+    DEFAULT_LANGUAGE,
+    SUPPORTED_LANGUAGES,
+    Translator,
+    _compile_template,
+    _parse_catalog_file,
+    _read_catalog_cache,
+    _render,
+    _SafeDict,
+    _write_catalog_cache,
+    get_translator,
+    reset_translator,
+    reset_translator_catalogs,
+)
+
+_module_home: tempfile.TemporaryDirectory | None = None
+_module_home_patcher = None
+
+
+def setUpModule():
+    """Point the home directory at a temp dir so no test touches the real ~/.cortex."""
+    global _module_home, _module_home_patcher
+    _module_home = tempfile.TemporaryDirectory()
+    _module_home_patcher = patch("pathlib.Path.home", return_value=Path(_module_home.name))
+    _module_home_patcher.start()
+
+
+def tearDownModule():
+    """Restore the real home directory."""
+    _module_home_patcher.stop()
+    _module_home.cleanup()
+
+
+@contextmanager
+def translator_sandbox():
+    """
+    Isolate a block from the global translator.
+
+    Resets on entry, and on exit only when the block left a global translator
+    behind (via set_language, t, the CLI, ...), so pure-read tests skip it.
+    """
+    reset_translator()
+    try:
+        yield
+    finally:
+        if translator_module._translator is not None:
+            reset_translator()
+
+
+def enter_translator_sandbox(test_case: unittest.TestCase) -> None:
+    """Run the rest of a test inside translator_sandbox."""
+    sandbox = translator_sandbox()
+    sandbox.__enter__()
+    test_case.addCleanup(sandbox.__exit__, None, None, None)
+
 
 class TestTranslator(unittest.TestCase):
     """Tests for the Translator class."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        # Reset global translator before each test
-        from cortex.i18n.translator import reset_translator
-
-        reset_translator()
-
-    def tearDown(self):
-        """Clean up after tests."""
-        from cortex.i18n.translator import reset_translator
-
-        reset_translator()
+    @classmethod
+    def setUpClass(cls):
+        """Parse each catalog once up front; later translators reuse them."""
+        cls._translators = {}
+        cls._keys = {}
+        for lang in ("en", "es", "fr", "de", "zh"):
+            translator = Translator(language=lang)
+            cls._keys[lang] = frozenset(translator.get_all_keys(lang))
+            cls._translators[lang] = translator
 
     def test_default_language_is_english(self):
         """Test that default language is English."""
-        from cortex.i18n.translator import DEFAULT_LANGUAGE, Translator
-
         translator = Translator()
         self.assertEqual(translator.language, DEFAULT_LANGUAGE)
         self.assertEqual(translator.language, "en")
 
     def test_set_language(self):
         """Test setting language to supported languages."""
-        from cortex.i18n.translator import Translator
-
         translator = Translator()
 
         for lang in ["en", "es", "fr", "de", "zh"]:
@@ -54,8 +123,6 @@ class TestTranslator(unittest.TestCase):
 
     def test_set_unsupported_language_raises(self):
         """Test that setting unsupported language raises ValueError."""
-        from cortex.i18n.translator import Translator
-
         translator = Translator()
 
         with self.assertRaises(ValueError) as context:
@@ -65,8 +132,6 @@ class TestTranslator(unittest.TestCase):
 
     def test_translate_basic_key(self):
         """Test basic translation of a key."""
-        from cortex.i18n.translator import Translator
-
         translator = Translator(language="en")
 
         # Test a key that should exist in all languages
@@ -75,18 +140,78 @@ class TestTranslator(unittest.TestCase):
 
     def test_translate_with_variables(self):
         """Test translation with variable interpolation."""
-        from cortex.i18n.translator import Translator
-
         translator = Translator(language="en")
 
         # Test interpolation
         result = translator.translate("language.changed", language="English")
         self.assertEqual(result, "Language changed to English")
 
+    def test_translate_with_variables_repeated_and_unhashable(self):
+        """Test cached interpolation with varying and unhashable values."""
+        translator = Translator(language="en")
+
+        for name in ("English", "Spanish", "English"):
+            result = translator.translate("language.changed", language=name)
+            self.assertEqual(result, f"Language changed to {name}")
+
+        result = translator.translate("language.changed", language=["en"])
+        self.assertEqual(result, "Language changed to ['en']")
+
+    def test_translate_uncacheable_values_not_memoized(self):
+        """Test values that may format differently despite comparing equal bypass the cache."""
+        translator = Translator(language="en")
+
+        for value in (Decimal("1.0"), Decimal("1.00")):
+            result = translator.translate("language.changed", language=value)
+            self.assertEqual(result, f"Language changed to {value}")
+
+        class Counter:
+            count = 0
+
+            def __str__(self):
+                return f"{self.count} pkgs"
+
+        counter = Counter()
+        translator.translate("language.changed", language=counter)
+        counter.count = 3
+        result = translator.translate("language.changed", language=counter)
+        self.assertEqual(result, "Language changed to 3 pkgs")
+        self.assertEqual(translator._interpolate_cached.cache_info().currsize, 0)
+
+    def test_translate_interpolation_memoized_per_language(self):
+        """Test repeated interpolated lookups are cached but never reused across languages."""
+        translator = Translator(language="en")
+
+        first = translator.translate("language.changed", language="Test")
+        self.assertIs(translator.translate("language.changed", language="Test"), first)
+        self.assertEqual(translator._interpolate_cached.cache_info().hits, 1)
+
+        translator.language = "es"
+        self.assertNotEqual(translator.translate("language.changed", language="Test"), first)
+
+    def test_translate_with_missing_variable_keeps_placeholder(self):
+        """Test that unspecified variables are left as placeholders."""
+        translator = Translator(language="en")
+
+        result = translator.translate("common.action_failed", action="Install")
+        self.assertEqual(result, "Install failed: {error}")
+
+    def test_compiled_templates_match_format_map(self):
+        """Test precompiled templates render exactly like str.format_map."""
+        kwargs = {"name": "docker", "count": 3}
+        for message in ("{name} installed", "{{literal}} {name}: {count}", "{name} {missing}"):
+            with self.subTest(message=message):
+                template = _compile_template(message)
+                self.assertIsNotNone(template)
+                self.assertEqual(_render(template, kwargs), message.format_map(_SafeDict(kwargs)))
+
+        # Anything beyond plain named fields is left to str.format_map
+        for message in ("{count:>3}", "{name!r}", "{0}", "{name.upper}", "{broken"):
+            with self.subTest(message=message):
+                self.assertIsNone(_compile_template(message))
+
     def test_translate_missing_key_returns_key(self):
         """Test that missing keys return the key itself."""
-        from cortex.i18n.translator import Translator
-
         translator = Translator(language="en")
 
         result = translator.translate("nonexistent.key.path")
@@ -94,8 +219,6 @@ class TestTranslator(unittest.TestCase):
 
     def test_translate_fallback_to_english(self):
         """Test fallback to English for missing translations."""
-        from cortex.i18n.translator import Translator
-
         translator = Translator(language="es")
 
         # Test a key that exists in English
@@ -106,8 +229,6 @@ class TestTranslator(unittest.TestCase):
 
     def test_debug_mode(self):
         """Test debug mode shows translation keys."""
-        from cortex.i18n.translator import Translator
-
         translator = Translator(language="en", debug=True)
 
         result = translator.translate("common.success")
@@ -115,8 +236,6 @@ class TestTranslator(unittest.TestCase):
 
     def test_debug_mode_toggle(self):
         """Test toggling debug mode."""
-        from cortex.i18n.translator import Translator
-
         translator = Translator(language="en")
         self.assertFalse(translator.debug)
 
@@ -126,355 +245,412 @@ class TestTranslator(unittest.TestCase):
         result = translator.translate("common.success")
         self.assertEqual(result, "[common.success]")
 
-    def test_global_translator_singleton(self):
-        """Test that get_translator returns the same instance."""
-        from cortex.i18n.translator import get_translator
-
-        t1 = get_translator()
-        t2 = get_translator()
-        self.assertIs(t1, t2)
-
-    def test_shorthand_t_function(self):
-        """Test the shorthand t() function."""
-        from cortex.i18n import set_language, t
-
-        # Ensure we're using English for this test
-        set_language("en")
-        result = t("common.success")
-        self.assertEqual(result, "Success")
+    def test_translations_all_languages(self):
+        """Test Spanish, French, German and Chinese translations."""
+        for lang, success, error in [
+            ("es", "Éxito", "Error"),
+            ("fr", "Succès", "Erreur"),
+            ("de", "Erfolg", "Fehler"),
+            ("zh", "成功", "错误"),
+        ]:
+            with self.subTest(lang=lang):
+                translator = self._translators[lang]
+                self.assertEqual(translator.translate("common.success"), success)
+                self.assertEqual(translator.translate("common.error"), error)
 
-    def test_set_language_global(self):
-        """Test set_language function."""
-        from cortex.i18n import get_language, set_language
-
-        set_language("es")
-        self.assertEqual(get_language(), "es")
+    def test_get_all_keys(self):
+        """Test getting all translation keys."""
+        keys = self._keys["en"]
 
-        set_language("en")
-        self.assertEqual(get_language(), "en")
+        # Subset comparison: one pass of hash lookups instead of an assertIn per key
+        self.assertLessEqual({"common.success", "common.error", "install.success"}, keys)
 
-    def test_spanish_translations(self):
-        """Test Spanish translations."""
-        from cortex.i18n.translator import Translator
+    def test_flat_catalog_keys_interned(self):
+        """Test that flattened catalog keys are interned strings."""
+        flat = self._translators["en"]._flat_catalogs["en"]
+        key = next(k for k in flat if k == "install.success")
+        self.assertIs(sys.intern("install.success"), key)
 
+    def test_non_english_catalog_loaded_lazily(self):
+        """Test that non-English catalogs are only parsed on first lookup."""
         translator = Translator(language="es")
+        self.assertNotIn("es", translator._catalogs)
 
         self.assertEqual(translator.translate("common.success"), "Éxito")
-        self.assertEqual(translator.translate("common.error"), "Error")
+        self.assertIn("es", translator._catalogs)
 
-    def test_french_translations(self):
-        """Test French translations."""
-        from cortex.i18n.translator import Translator
+    def test_parsed_catalogs_shared_between_translators(self):
+        """Test that each catalog is parsed once and reused by new translators."""
+        first = Translator(language="es")
+        first.get_all_keys("es")
 
-        translator = Translator(language="fr")
+        # Resetting the global translator keeps the parsed catalogs
+        reset_translator()
 
-        self.assertEqual(translator.translate("common.success"), "Succès")
-        self.assertEqual(translator.translate("common.error"), "Erreur")
+        second = Translator(language="es")
+        second.get_all_keys("es")
+        self.assertIs(second._catalogs["es"], first._catalogs["es"])
+        self.assertIs(second._catalogs["en"], first._catalogs["en"])
+        self.assertIs(second._flat_catalogs["es"], first._flat_catalogs["es"])
+
+        # Dropping the catalogs forces a fresh parse
+        reset_translator_catalogs()
+        third = Translator(language="es")
+        third.get_all_keys("es")
+        self.assertIsNot(third._catalogs["es"], first._catalogs["es"])
+        self.assertEqual(third._catalogs["es"], first._catalogs["es"])
+
+    def test_concurrent_first_lookups_parse_catalog_once(self):
+        """Test that threads racing to load a catalog share a single parse."""
+        reset_translator_catalogs()
+        with patch(
+            "cortex.i18n.translator._parse_catalog_file",
+            wraps=_parse_catalog_file,
+        ) as parse:
+            threads = [
+                threading.Thread(
+                    target=Translator(language="fr").translate, args=("common.success",)
+                )
+                for _ in range(8)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        parsed_paths = [call.args[0].name for call in parse.call_args_list]
+        self.assertEqual(parsed_paths.count("fr.yaml"), 1)
+
+    def test_catalog_cache_written_and_reused(self):
+        """Test that parsed catalogs are cached and corrupt caches are ignored."""
+        # Start from an empty in-process cache so the on-disk cache is exercised
+        reset_translator_catalogs()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            (Path(temp_dir) / ".cortex").mkdir()
+            with patch("pathlib.Path.home", return_value=Path(temp_dir)):
+                Translator(language="es").translate("common.success")
+
+                cache_dir = Path(temp_dir) / ".cortex" / "i18n_cache"
+                cache_files = list(cache_dir.glob("es.*.marshal"))
+                self.assertEqual(len(cache_files), 1)
+
+                # A corrupt cache must fall back to parsing the YAML catalog
+                cache_files[0].write_bytes(b"not a marshal payload")
+                reset_translator_catalogs()
+                translator = Translator(language="es")
+                self.assertEqual(translator.translate("common.success"), "Éxito")
+
+    def test_catalog_cache_requires_existing_cortex_dir(self):
+        """Test that loading catalogs never creates ~/.cortex."""
+        reset_translator_catalogs()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with patch("pathlib.Path.home", return_value=Path(temp_dir)):
+                Translator(language="de").translate("common.success")
+
+            self.assertFalse((Path(temp_dir) / ".cortex").exists())
+
+    def test_catalog_cache_keyed_on_source_path(self):
+        """Test that a cache written for one catalog path is ignored for another."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_path = Path(temp_dir) / "i18n_cache" / "es.marshal"
+            source = Path(temp_dir) / "a" / "es.yaml"
+            _write_catalog_cache(cache_path, source, (1, 2), {"common": {"ok": "Sí"}})
+
+            self.assertEqual(
+                _read_catalog_cache(cache_path, source, (1, 2)), {"common": {"ok": "Sí"}}
+            )
+            self.assertIsNone(
+                _read_catalog_cache(cache_path, Path(temp_dir) / "b" / "es.yaml", (1, 2))
+            )
 
-    def test_german_translations(self):
-        """Test German translations."""
-        from cortex.i18n.translator import Translator
+    def test_catalog_cache_write_failures_leave_no_files(self):
+        """Test that failed cache writes don't leak temp files."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_dir = Path(temp_dir) / "i18n_cache"
+            cache_path = cache_dir / "es.marshal"
+            source = Path(temp_dir) / "es.yaml"
 
-        translator = Translator(language="de")
+            # YAML dates are not marshalable
+            _write_catalog_cache(cache_path, source, (1, 2), {"released": datetime(2024, 1, 1)})
+            self.assertFalse(cache_dir.exists())
 
-        self.assertEqual(translator.translate("common.success"), "Erfolg")
-        self.assertEqual(translator.translate("common.error"), "Fehler")
+            with patch("cortex.i18n.translator.os.replace", side_effect=OSError):
+                _write_catalog_cache(cache_path, source, (1, 2), {"common": {"ok": "Sí"}})
+            self.assertEqual(list(cache_dir.iterdir()), [])
 
-    def test_chinese_translations(self):
-        """Test Chinese translations."""
-        from cortex.i18n.translator import Translator
+    def test_get_missing_translations(self):
+        """Test finding missing translations."""
+        translator = Translator(language="en")
 
-        translator = Translator(language="zh")
+        # All keys should be present in English (source)
+        missing = translator.get_missing_translations("en")
+        self.assertEqual(len(missing), 0)
 
-        self.assertEqual(translator.translate("common.success"), "成功")
-        self.assertEqual(translator.translate("common.error"), "错误")
 
-    def test_get_all_keys(self):
-        """Test getting all translation keys."""
-        from cortex.i18n.translator import Translator
+class TestGlobalTranslator(unittest.TestCase):
+    """Tests for the global translator instance."""
 
-        translator = Translator(language="en")
-        keys = translator.get_all_keys()
+    def setUp(self):
+        """Isolate each test from the global translator."""
+        enter_translator_sandbox(self)
 
-        self.assertIn("common.success", keys)
-        self.assertIn("common.error", keys)
-        self.assertIn("install.success", keys)
+    def test_global_translator_singleton(self):
+        """Test that get_translator returns the same instance."""
+        t1 = get_translator()
+        t2 = get_translator()
+        self.assertIs(t1, t2)
 
-    def test_get_missing_translations(self):
-        """Test finding missing translations."""
-        from cortex.i18n.translator import Translator
+    def test_shorthand_t_function(self):
+        """Test the shorthand t() function."""
+        # Ensure we're using English for this test
+        set_language("en")
+        result = t("common.success")
+        self.assertEqual(result, "Success")
 
-        translator = Translator(language="en")
+    def test_set_language_global(self):
+        """Test set_language function."""
+        set_language("es")
+        self.assertEqual(get_language(), "es")
 
-        # All keys should be present in English (source)
-        missing = translator.get_missing_translations("en")
-        self.assertEqual(len(missing), 0)
+        set_language("en")
+        self.assertEqual(get_language(), "en")
+
+    def test_translator_sandbox_resets_only_when_dirty(self):
+        """Test translator_sandbox skips the exit reset for untouched blocks."""
+        with patch(f"{__name__}.reset_translator", wraps=reset_translator) as mock_reset:
+            with translator_sandbox():
+                pass
+            self.assertEqual(mock_reset.call_count, 1)
+
+            with translator_sandbox():
+                set_language("de")
+            self.assertEqual(mock_reset.call_count, 3)
+        self.assertIsNone(translator_module._translator)
 
 
 class TestLanguageConfig(unittest.TestCase):
     """Tests for language configuration persistence."""
 
     def setUp(self):
-        """Set up test fixtures with temp directory."""
+        """Set up test fixtures with temp directory as the home directory."""
         self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
         self.temp_home = Path(self.temp_dir.name)
 
-        # Reset global translator
-        from cortex.i18n.translator import reset_translator
-
-        reset_translator()
+        self._home_patcher = patch("pathlib.Path.home", return_value=self.temp_home)
+        self._home_patcher.start()
+        self.addCleanup(self._home_patcher.stop)
 
-    def tearDown(self):
-        """Clean up temp directory."""
-        self.temp_dir.cleanup()
+        enter_translator_sandbox(self)
 
-        from cortex.i18n.translator import reset_translator
+    def _mock_preferences(self, content):
+        """Serve content as the preferences file's text."""
+        # _load_preferences stats the real file before reading it
+        preferences_file = self.temp_home / ".cortex" / "preferences.yaml"
+        preferences_file.parent.mkdir(parents=True, exist_ok=True)
+        preferences_file.write_text("placeholder\n")
 
-        reset_translator()
+        patcher = patch.object(LanguageConfig, "_read_preferences_text", return_value=content)
+        patcher.start()
+        self.addCleanup(patcher.stop)
 
     def test_malformed_yaml_returns_empty_dict(self):
         """Test that malformed YAML in preferences file returns empty dict and doesn't crash."""
-        with patch("pathlib.Path.home", return_value=self.temp_home):
-            from cortex.i18n.config import LanguageConfig
-
-            config = LanguageConfig()
+        config = LanguageConfig()
 
-            # Create malformed YAML file
-            prefs_file = self.temp_home / ".cortex" / "preferences.yaml"
-            prefs_file.parent.mkdir(parents=True, exist_ok=True)
-            prefs_file.write_text("invalid: yaml: content: [broken")
+        # Serve malformed YAML
+        self._mock_preferences("invalid: yaml: content: [broken")
 
-            # Should not crash, should return default language
-            lang = config.get_language()
-            self.assertEqual(lang, "en")
+        # Should not crash, should return default language
+        lang = config.get_language()
+        self.assertEqual(lang, "en")
 
     def test_empty_yaml_file_returns_empty_dict(self):
         """Test that empty preferences file returns empty dict."""
-        with patch("pathlib.Path.home", return_value=self.temp_home):
-            from cortex.i18n.config import LanguageConfig
+        config = LanguageConfig()
 
-            config = LanguageConfig()
+        # Serve an empty file
+        self._mock_preferences("")
 
-            # Create empty file
-            prefs_file = self.temp_home / ".cortex" / "preferences.yaml"
-            prefs_file.parent.mkdir(parents=True, exist_ok=True)
-            prefs_file.write_text("")
-
-            # Should not crash, should return default language
-            lang = config.get_language()
-            self.assertEqual(lang, "en")
+        # Should not crash, should return default language
+        lang = config.get_language()
+        self.assertEqual(lang, "en")
 
     def test_whitespace_only_yaml_file_returns_empty_dict(self):
         """Test that whitespace-only preferences file returns empty dict."""
-        with patch("pathlib.Path.home", return_value=self.temp_home):
-            from cortex.i18n.config import LanguageConfig
-
-            config = LanguageConfig()
+        config = LanguageConfig()
 
-            # Create whitespace-only file
-            prefs_file = self.temp_home / ".cortex" / "preferences.yaml"
-            prefs_file.parent.mkdir(parents=True, exist_ok=True)
-            prefs_file.write_text("   \n\t\n  ")
+        # Serve a whitespace-only file
+        self._mock_preferences("   \n\t\n  ")
 
-            # Should not crash, should return default language
-            lang = config.get_language()
-            self.assertEqual(lang, "en")
+        # Should not crash, should return default language
+        lang = config.get_language()
+        self.assertEqual(lang, "en")
 
     def test_invalid_type_in_yaml_returns_empty_dict(self):
         """Test that YAML with invalid root type (not dict) returns empty dict."""
-        with patch("pathlib.Path.home", return_value=self.temp_home):
-            from cortex.i18n.config import LanguageConfig
+        config = LanguageConfig()
 
-            config = LanguageConfig()
+        # Serve YAML with list instead of dict
+        self._mock_preferences("- item1\n- item2\n- item3")
 
-            # Create YAML file with list instead of dict
-            prefs_file = self.temp_home / ".cortex" / "preferences.yaml"
-            prefs_file.parent.mkdir(parents=True, exist_ok=True)
-            prefs_file.write_text("- item1\n- item2\n- item3")
-
-            # Should not crash, should return default language
-            lang = config.get_language()
-            self.assertEqual(lang, "en")
+        # Should not crash, should return default language
+        lang = config.get_language()
+        self.assertEqual(lang, "en")
 
     def test_yaml_with_string_root_returns_empty_dict(self):
         """Test that YAML with string root type returns empty dict."""
-        with patch("pathlib.Path.home", return_value=self.temp_home):
-            from cortex.i18n.config import LanguageConfig
-
-            config = LanguageConfig()
+        config = LanguageConfig()
 
-            # Create YAML file with just a string
-            prefs_file = self.temp_home / ".cortex" / "preferences.yaml"
-            prefs_file.parent.mkdir(parents=True, exist_ok=True)
-            prefs_file.write_text("just a plain string")
+        # Serve YAML with just a string
+        self._mock_preferences("just a plain string")
 
-            # Should not crash, should return default language
-            lang = config.get_language()
-            self.assertEqual(lang, "en")
+        # Should not crash, should return default language
+        lang = config.get_language()
+        self.assertEqual(lang, "en")
 
     def test_yaml_with_invalid_language_type_uses_default(self):
         """Test that YAML with non-string language value uses default."""
-        with patch("pathlib.Path.home", return_value=self.temp_home):
-            from cortex.i18n.config import LanguageConfig
+        config = LanguageConfig()
 
-            config = LanguageConfig()
-
-            # Create YAML file with integer language
-            prefs_file = self.temp_home / ".cortex" / "preferences.yaml"
-            prefs_file.parent.mkdir(parents=True, exist_ok=True)
-            prefs_file.write_text("language: 123")
+        # Serve YAML with integer language
+        self._mock_preferences("language: 123")
 
-            # Should not crash, should return default language
-            lang = config.get_language()
-            self.assertEqual(lang, "en")
+        # Should not crash, should return default language
+        lang = config.get_language()
+        self.assertEqual(lang, "en")
 
     def test_yaml_with_null_language_uses_default(self):
         """Test that YAML with null language value uses default."""
-        with patch("pathlib.Path.home", return_value=self.temp_home):
-            from cortex.i18n.config import LanguageConfig
+        config = LanguageConfig()
 
-            config = LanguageConfig()
+        # Serve YAML with null language
+        self._mock_preferences("language: null")
 
-            # Create YAML file with null language
-            prefs_file = self.temp_home / ".cortex" / "preferences.yaml"
-            prefs_file.parent.mkdir(parents=True, exist_ok=True)
-            prefs_file.write_text("language: null")
+        # Should not crash, should return default language
+        lang = config.get_language()
+        self.assertEqual(lang, "en")
 
-            # Should not crash, should return default language
-            lang = config.get_language()
-            self.assertEqual(lang, "en")
+    def test_init_does_not_create_cortex_dir(self):
+        """Test that constructing a config for reading doesn't create ~/.cortex."""
+        config = LanguageConfig()
+        config.get_language()
+
+        self.assertFalse((self.temp_home / ".cortex").exists())
 
     def test_get_language_default(self):
         """Test default language when no preference is set."""
-        with patch("pathlib.Path.home", return_value=self.temp_home):
-            with patch.dict(os.environ, {}, clear=True):
-                from cortex.i18n.config import LanguageConfig
-
-                config = LanguageConfig()
-                lang = config.get_language()
-                # Should fall back to English since no env var, no config, and no OS detection
-                self.assertEqual(lang, "en")
+        with patch.dict(os.environ, {}, clear=True):
+            config = LanguageConfig()
+            lang = config.get_language()
+            # Should fall back to English since no env var, no config, and no OS detection
+            self.assertEqual(lang, "en")
 
     def test_set_and_get_language(self):
         """Test setting and getting language preference."""
-        with patch("pathlib.Path.home", return_value=self.temp_home):
-            from cortex.i18n.config import LanguageConfig
-
-            config = LanguageConfig()
-            config.set_language("es")
-
-            # Create new config instance to test persistence
-            config2 = LanguageConfig()
-            self.assertEqual(config2.get_language(), "es")
+        config = LanguageConfig()
+        config.set_language("es")
+
+        # Create new config instance to test persistence
+        config2 = LanguageConfig()
+        self.assertEqual(config2.get_language(), "es")
+
+    def test_preferences_cached_until_file_changes(self):
+        """Test that unchanged preferences are served without re-reading the file."""
+        LanguageConfig().set_language("es")
+
+        config = LanguageConfig()
+        with patch.object(
+            LanguageConfig, "_read_preferences_text", wraps=config._read_preferences_text
+        ) as read:
+            self.assertEqual(config._load_preferences(), {"language": "es"})
+            read.assert_not_called()
+
+            # An external edit changes the file's stat and invalidates the cache
+            preferences_file = self.temp_home / ".cortex" / "preferences.yaml"
+            preferences_file.write_text("language: de\ntheme: dark\n")
+            self.assertEqual(config._load_preferences(), {"language": "de", "theme": "dark"})
+            read.assert_called_once()
+
+        # A same-size replacement within the same mtime tick is still detected
+        old_stat = preferences_file.stat()
+        replacement = preferences_file.with_suffix(".tmp")
+        replacement.write_text("language: fr\ntheme: dark\n")
+        os.replace(replacement, preferences_file)
+        os.utime(preferences_file, ns=(old_stat.st_atime_ns, old_stat.st_mtime_ns))
+        self.assertEqual(preferences_file.stat().st_size, old_stat.st_size)
+        self.assertEqual(config._load_preferences(), {"language": "fr", "theme": "dark"})
+        LanguageConfig().set_language("de")
+
+        # Callers get a copy they can modify freely
+        config._load_preferences()["language"] = "fr"
+        self.assertEqual(config._load_preferences()["language"], "de")
 
     def test_set_invalid_language_raises(self):
         """Test that setting invalid language raises ValueError."""
-        with patch("pathlib.Path.home", return_value=self.temp_home):
-            from cortex.i18n.config import LanguageConfig
+        config = LanguageConfig()
 
-            config = LanguageConfig()
-
-            with self.assertRaises(ValueError):
-                config.set_language("invalid")
+        with self.assertRaises(ValueError):
+            config.set_language("invalid")
 
     def test_env_variable_override(self):
         """Test CORTEX_LANGUAGE environment variable takes precedence."""
-        with patch("pathlib.Path.home", return_value=self.temp_home):
-            with patch.dict(os.environ, {"CORTEX_LANGUAGE": "fr"}, clear=True):
-                from cortex.i18n.config import LanguageConfig
-
-                config = LanguageConfig()
-                # First set a different language
-                config.set_language("de")
+        with patch.dict(os.environ, {"CORTEX_LANGUAGE": "fr"}, clear=True):
+            config = LanguageConfig()
+            # First set a different language
+            config.set_language("de")
 
-                # But env var should take precedence
-                self.assertEqual(config.get_language(), "fr")
+            # But env var should take precedence
+            self.assertEqual(config.get_language(), "fr")
 
     def test_clear_language(self):
         """Test clearing language preference."""
-        with patch("pathlib.Path.home", return_value=self.temp_home):
-            with patch.dict(os.environ, {}, clear=True):
-                from cortex.i18n.config import LanguageConfig
-
-                config = LanguageConfig()
-                config.set_language("de")
-                self.assertEqual(config.get_language(), "de")
+        with patch.dict(os.environ, {}, clear=True):
+            config = LanguageConfig()
+            config.set_language("de")
+            self.assertEqual(config.get_language(), "de")
 
-                config.clear_language()
-                # Should fall back to default
-                self.assertEqual(config.get_language(), "en")
+            config.clear_language()
+            # Should fall back to default
+            self.assertEqual(config.get_language(), "en")
 
     def test_get_language_info(self):
         """Test getting detailed language info."""
-        with patch("pathlib.Path.home", return_value=self.temp_home):
-            from cortex.i18n.config import LanguageConfig
-
-            config = LanguageConfig()
-            config.set_language("es")
+        config = LanguageConfig()
+        config.set_language("es")
 
-            info = config.get_language_info()
+        info = config.get_language_info()
 
-            self.assertEqual(info["language"], "es")
-            self.assertEqual(info["source"], "config")
-            self.assertEqual(info["name"], "Spanish")
-            self.assertEqual(info["native_name"], "Español")
+        self.assertEqual(info["language"], "es")
+        self.assertEqual(info["source"], "config")
+        self.assertEqual(info["name"], "Spanish")
+        self.assertEqual(info["native_name"], "Español")
 
 
 class TestLanguageDetector(unittest.TestCase):
     """Tests for OS language auto-detection."""
 
-    def test_detect_english_from_lang(self):
-        """Test detection of English from LANG variable."""
-        from cortex.i18n.detector import detect_os_language
-
-        with patch.dict(os.environ, {"LANG": "en_US.UTF-8"}, clear=True):
-            lang = detect_os_language()
-            self.assertEqual(lang, "en")
-
-    def test_detect_spanish_from_lang(self):
-        """Test detection of Spanish from LANG variable."""
-        from cortex.i18n.detector import detect_os_language
-
-        with patch.dict(os.environ, {"LANG": "es_ES.UTF-8"}, clear=True):
-            lang = detect_os_language()
-            self.assertEqual(lang, "es")
-
-    def test_detect_french_from_lang(self):
-        """Test detection of French from LANG variable."""
-        from cortex.i18n.detector import detect_os_language
-
-        with patch.dict(os.environ, {"LANG": "fr_FR.UTF-8"}, clear=True):
-            lang = detect_os_language()
-            self.assertEqual(lang, "fr")
-
-    def test_detect_german_from_lang(self):
-        """Test detection of German from LANG variable."""
-        from cortex.i18n.detector import detect_os_language
-
-        with patch.dict(os.environ, {"LANG": "de_DE.UTF-8"}, clear=True):
-            lang = detect_os_language()
-            self.assertEqual(lang, "de")
-
-    def test_detect_chinese_from_lang(self):
-        """Test detection of Chinese from LANG variable."""
-        from cortex.i18n.detector import detect_os_language
-
-        with patch.dict(os.environ, {"LANG": "zh_CN.UTF-8"}, clear=True):
-            lang = detect_os_language()
-            self.assertEqual(lang, "zh")
+    def test_detect_from_lang(self):
+        """Test detection of each supported language from LANG variable."""
+        for locale, expected in [
+            ("en_US.UTF-8", "en"),
+            ("es_ES.UTF-8", "es"),
+            ("fr_FR.UTF-8", "fr"),
+            ("de_DE.UTF-8", "de"),
+            ("zh_CN.UTF-8", "zh"),
+        ]:
+            with self.subTest(locale=locale):
+                with patch.dict(os.environ, {"LANG": locale}, clear=True):
+                    self.assertEqual(detect_os_language(), expected)
 
     def test_lc_all_takes_precedence(self):
         """Test that LC_ALL takes precedence over LANG."""
-        from cortex.i18n.detector import detect_os_language
-
         with patch.dict(os.environ, {"LANG": "en_US.UTF-8", "LC_ALL": "fr_FR.UTF-8"}, clear=True):
             lang = detect_os_language()
             self.assertEqual(lang, "fr")
 
     def test_language_variable_takes_precedence(self):
         """Test that LANGUAGE takes precedence over LC_ALL."""
-        from cortex.i18n.detector import detect_os_language
-
         with patch.dict(
             os.environ,
             {"LANGUAGE": "de", "LC_ALL": "fr_FR.UTF-8", "LANG": "en_US.UTF-8"},
@@ -485,40 +661,42 @@ class TestLanguageDetector(unittest.TestCase):
 
     def test_fallback_to_english(self):
         """Test fallback to English when no supported language detected."""
-        from cortex.i18n.detector import detect_os_language
-
         with patch.dict(os.environ, {"LANG": "ja_JP.UTF-8"}, clear=True):
             lang = detect_os_language()
             self.assertEqual(lang, "en")
 
     def test_c_locale_returns_english(self):
         """Test that C locale returns English."""
-        from cortex.i18n.detector import detect_os_language
-
         with patch.dict(os.environ, {"LANG": "C"}, clear=True):
             lang = detect_os_language()
             self.assertEqual(lang, "en")
 
     def test_posix_locale_returns_english(self):
         """Test that POSIX locale returns English."""
-        from cortex.i18n.detector import detect_os_language
-
         with patch.dict(os.environ, {"LANG": "POSIX"}, clear=True):
             lang = detect_os_language()
             self.assertEqual(lang, "en")
 
     def test_empty_env_returns_english(self):
         """Test fallback to English when no env vars set."""
-        from cortex.i18n.detector import detect_os_language
-
         with patch.dict(os.environ, {}, clear=True):
             lang = detect_os_language()
             self.assertEqual(lang, "en")
 
+    def test_detector_is_memoized(self):
+        """Test repeated detection with an unchanged environment hits the cache."""
+        _detect.cache_clear()
+        with patch.dict(os.environ, {"LANG": "de_DE.UTF-8"}, clear=True):
+            self.assertEqual(detect_os_language(), "de")
+            self.assertEqual(detect_os_language(), "de")
+        self.assertGreater(_detect.cache_info().hits, 0)
+
+        # A changed environment is a different cache key
+        with patch.dict(os.environ, {"LANG": "fr_FR.UTF-8"}, clear=True):
+            self.assertEqual(detect_os_language(), "fr")
+
     def test_get_os_locale_info(self):
         """Test getting OS locale info for debugging."""
-        from cortex.i18n.detector import get_os_locale_info
-
         with patch.dict(os.environ, {"LANG": "en_US.UTF-8", "LC_ALL": ""}, clear=True):
             info = get_os_locale_info()
 
@@ -530,215 +708,290 @@ class TestLanguageDetector(unittest.TestCase):
 class TestLocaleFormatter(unittest.TestCase):
     """Tests for locale-aware formatting."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Create one formatter per language; formatting doesn't change their state."""
+        cls.fmt_en = LocaleFormatter(language="en")
+        cls.fmt_de = LocaleFormatter(language="de")
+        cls.fmt_fr = LocaleFormatter(language="fr")
+        cls.fmt_es = LocaleFormatter(language="es")
+        cls.fmt_zh = LocaleFormatter(language="zh")
+        # Fixed reference time; the time-ago tests only compare offsets from it
+        cls._now = datetime(2024, 1, 1, 12, 0, 0)
+
     def test_format_date_english(self):
         """Test date formatting in English locale."""
-        from cortex.i18n.formatter import LocaleFormatter
-
-        formatter = LocaleFormatter(language="en")
         dt = datetime(2024, 3, 15)
 
-        result = formatter.format_date(dt)
+        result = self.fmt_en.format_date(dt)
         self.assertEqual(result, "2024-03-15")
 
     def test_format_date_german(self):
         """Test date formatting in German locale."""
-        from cortex.i18n.formatter import LocaleFormatter
-
-        formatter = LocaleFormatter(language="de")
         dt = datetime(2024, 3, 15)
 
-        result = formatter.format_date(dt)
+        result = self.fmt_de.format_date(dt)
         self.assertEqual(result, "15.03.2024")
 
     def test_format_date_french(self):
         """Test date formatting in French locale."""
-        from cortex.i18n.formatter import LocaleFormatter
-
-        formatter = LocaleFormatter(language="fr")
         dt = datetime(2024, 3, 15)
 
-        result = formatter.format_date(dt)
+        result = self.fmt_fr.format_date(dt)
         self.assertEqual(result, "15/03/2024")
 
-    def test_format_number_english(self):
-        """Test number formatting in English locale."""
-        from cortex.i18n.formatter import LocaleFormatter
+    def test_precompiled_formats_match_strftime(self):
+        """Test that precompiled date/time formats match strftime output."""
+        dt = datetime(2024, 3, 15, 0, 5, 9)
+        for lang, config in LOCALE_CONFIGS.items():
+            formatter = LocaleFormatter(language=lang)
+            self.assertEqual(formatter.format_date(dt), dt.strftime(config["date_format"]))
+            self.assertEqual(formatter.format_time(dt), dt.strftime(config["time_format"]))
+            self.assertEqual(formatter.format_datetime(dt), dt.strftime(config["datetime_format"]))
+            self.assertEqual(
+                formatter.format_datetime(dt, full=True), dt.strftime(config["datetime_full"])
+            )
 
-        formatter = LocaleFormatter(language="en")
+    def test_locale_configs_read_only_and_formatter_slotted(self):
+        """Test that locale configs cannot be mutated and formatters use slots."""
+        with self.assertRaises(TypeError):
+            LOCALE_CONFIGS["xx"] = {}
+
+        formatter = LocaleFormatter(language="de")
+        self.assertFalse(hasattr(formatter, "__dict__"))
+        formatter.language = "fr"
+        self.assertEqual(formatter.language, "fr")
 
-        result = formatter.format_number(1234567)
+    def test_format_number_english(self):
+        """Test number formatting in English locale."""
+        result = self.fmt_en.format_number(1234567)
         self.assertEqual(result, "1,234,567")
 
     def test_format_number_german(self):
         """Test number formatting in German locale."""
-        from cortex.i18n.formatter import LocaleFormatter
-
-        formatter = LocaleFormatter(language="de")
-
-        result = formatter.format_number(1234567)
+        result = self.fmt_de.format_number(1234567)
         self.assertEqual(result, "1.234.567")
 
     def test_format_number_french(self):
         """Test number formatting in French locale."""
-        from cortex.i18n.formatter import LocaleFormatter
-
-        formatter = LocaleFormatter(language="fr")
-
-        result = formatter.format_number(1234567)
+        result = self.fmt_fr.format_number(1234567)
         self.assertEqual(result, "1 234 567")
 
     def test_format_number_with_decimals(self):
         """Test number formatting with decimal places."""
-        from cortex.i18n.formatter import LocaleFormatter
+        result = self.fmt_en.format_number(1234.567, decimals=2)
+        self.assertEqual(result, "1,234.57")
 
-        formatter = LocaleFormatter(language="en")
+    def test_format_number_german_with_decimals(self):
+        """Test that swapped separators are applied in a single pass."""
+        result = self.fmt_de.format_number(1234.567, decimals=2)
+        self.assertEqual(result, "1.234,57")
 
-        result = formatter.format_number(1234.567, decimals=2)
-        self.assertEqual(result, "1,234.57")
+    def test_format_number_separator_swap_per_locale(self):
+        """Test separators are only remapped for locales that differ from en."""
+        self.assertEqual(self.fmt_fr.format_number(1234.567, 2), "1 234,57")
+        self.assertEqual(self.fmt_zh.format_number(1234.567, 2), "1,234.57")
 
     def test_format_file_size_bytes(self):
         """Test file size formatting for bytes."""
-        from cortex.i18n.formatter import LocaleFormatter
-
-        formatter = LocaleFormatter(language="en")
-
-        result = formatter.format_file_size(500)
+        result = self.fmt_en.format_file_size(500)
         self.assertEqual(result, "500 B")
 
     def test_format_file_size_kb(self):
         """Test file size formatting for kilobytes."""
-        from cortex.i18n.formatter import LocaleFormatter
-
-        formatter = LocaleFormatter(language="en")
-
-        result = formatter.format_file_size(1536)
+        result = self.fmt_en.format_file_size(1536)
         self.assertIn("KB", result)
 
     def test_format_file_size_mb(self):
         """Test file size formatting for megabytes."""
-        from cortex.i18n.formatter import LocaleFormatter
-
-        formatter = LocaleFormatter(language="en")
-
-        result = formatter.format_file_size(1536 * 1024)
+        result = self.fmt_en.format_file_size(1536 * 1024)
         self.assertIn("MB", result)
 
     def test_format_file_size_gb(self):
         """Test file size formatting for gigabytes."""
-        from cortex.i18n.formatter import LocaleFormatter
-
-        formatter = LocaleFormatter(language="en")
-
-        result = formatter.format_file_size(2 * 1024 * 1024 * 1024)
+        result = self.fmt_en.format_file_size(2 * 1024 * 1024 * 1024)
         self.assertIn("GB", result)
 
+    def test_format_file_size_unit_boundaries(self):
+        """Test exact file size output around each power of 1024."""
+        cases = {
+            0: "0 B",
+            1: "1.00 B",
+            1023: "1,023 B",
+            1024: "1.00 KB",
+            1025: "1.00 KB",
+            10239: "10.00 KB",
+            10240: "10.0 KB",
+            102400: "100 KB",
+            1024**2 - 1: "1,023 KB",
+            1024**2: "1.00 MB",
+            1024**3: "1.00 GB",
+            1024**4: "1.00 TB",
+            1024**5: "1,024 TB",
+            3 * 1024**5: "3,072 TB",
+        }
+        for size, expected in cases.items():
+            with self.subTest(size=size):
+                self.assertEqual(self.fmt_en.format_file_size(size), expected)
+
+        self.assertEqual(self.fmt_fr.format_file_size(1536), "1,50 Ko")
+        self.assertEqual(self.fmt_fr.format_file_size(1024**3), "1,00 Go")
+
     def test_format_time_ago_just_now(self):
         """Test relative time for just now."""
-        from cortex.i18n.formatter import LocaleFormatter
-
-        formatter = LocaleFormatter(language="en")
-        now = datetime.now()
+        now = self._now
 
-        result = formatter.format_time_ago(now, now)
+        result = self.fmt_en.format_time_ago(now, now)
         self.assertEqual(result, "just now")
 
     def test_format_time_ago_seconds(self):
         """Test relative time for seconds."""
-        from cortex.i18n.formatter import LocaleFormatter
-
-        formatter = LocaleFormatter(language="en")
-        now = datetime.now()
+        now = self._now
         past = now - timedelta(seconds=30)
 
-        result = formatter.format_time_ago(past, now)
+        result = self.fmt_en.format_time_ago(past, now)
         self.assertIn("seconds ago", result)
 
     def test_format_time_ago_minutes(self):
         """Test relative time for minutes."""
-        from cortex.i18n.formatter import LocaleFormatter
-
-        formatter = LocaleFormatter(language="en")
-        now = datetime.now()
+        now = self._now
         past = now - timedelta(minutes=5)
 
-        result = formatter.format_time_ago(past, now)
+        result = self.fmt_en.format_time_ago(past, now)
         self.assertIn("minutes ago", result)
 
     def test_format_time_ago_hours(self):
         """Test relative time for hours."""
-        from cortex.i18n.formatter import LocaleFormatter
-
-        formatter = LocaleFormatter(language="en")
-        now = datetime.now()
+        now = self._now
         past = now - timedelta(hours=3)
 
-        result = formatter.format_time_ago(past, now)
+        result = self.fmt_en.format_time_ago(past, now)
         self.assertIn("hours ago", result)
 
     def test_format_time_ago_spanish(self):
         """Test relative time in Spanish."""
-        from cortex.i18n.formatter import LocaleFormatter
-
-        formatter = LocaleFormatter(language="es")
-        now = datetime.now()
+        now = self._now
         past = now - timedelta(minutes=5)
 
-        result = formatter.format_time_ago(past, now)
+        result = self.fmt_es.format_time_ago(past, now)
         self.assertIn("hace", result)
         self.assertIn("minutos", result)
 
     def test_format_time_ago_chinese(self):
         """Test relative time in Chinese."""
-        from cortex.i18n.formatter import LocaleFormatter
-
-        formatter = LocaleFormatter(language="zh")
-        now = datetime.now()
+        now = self._now
         past = now - timedelta(minutes=5)
 
-        result = formatter.format_time_ago(past, now)
+        result = self.fmt_zh.format_time_ago(past, now)
         self.assertIn("分钟前", result)
 
+    def test_format_time_ago_bucket_boundaries(self):
+        """Test exact relative time output on both sides of every unit cutoff."""
+        cases = {
+            0: "just now",
+            4: "just now",
+            5: "5 seconds ago",
+            59: "59 seconds ago",
+            60: "1 minute ago",
+            119: "1 minute ago",
+            120: "2 minutes ago",
+            3599: "59 minutes ago",
+            3600: "1 hour ago",
+            7200: "2 hours ago",
+            86399: "23 hours ago",
+            86400: "1 day ago",
+            172800: "2 days ago",
+            604799: "6 days ago",
+            604800: "1 week ago",
+            1209600: "2 weeks ago",
+            2591999: "4 weeks ago",
+            2592000: "1 month ago",
+            5184000: "2 months ago",
+            31535999: "12 months ago",
+            31536000: "1 year ago",
+            63072000: "2 years ago",
+            -5: "just now",
+        }
+        now = self._now
+        for seconds, expected in cases.items():
+            with self.subTest(seconds=seconds):
+                past = now - timedelta(seconds=seconds)
+                self.assertEqual(self.fmt_en.format_time_ago(past, now), expected)
+
+    def test_format_time_ago_singular_forms(self):
+        """Test singular relative time keys are used for a count of one."""
+        cases = {
+            60: "vor 1 Minute",
+            3600: "vor 1 Stunde",
+            86400: "vor 1 Tag",
+            604800: "vor 1 Woche",
+            2592000: "vor 1 Monat",
+            31536000: "vor 1 Jahr",
+            63072000: "vor 2 Jahren",
+        }
+        now = self._now
+        for seconds, expected in cases.items():
+            with self.subTest(seconds=seconds):
+                past = now - timedelta(seconds=seconds)
+                self.assertEqual(self.fmt_de.format_time_ago(past, now), expected)
+
+    def test_format_time_ago_bulk(self):
+        """Test bulk relative time formatting matches per-item formatting."""
+        now = self._now
+        dts = [now, now - timedelta(minutes=5), now - timedelta(hours=1)]
+
+        self.assertEqual(
+            self.fmt_en.format_time_ago_bulk(dts, now),
+            [self.fmt_en.format_time_ago(dt, now) for dt in dts],
+        )
+        self.assertEqual(self.fmt_en.format_time_ago_bulk([]), [])
+
     def test_format_duration_milliseconds(self):
         """Test duration formatting for milliseconds."""
-        from cortex.i18n.formatter import LocaleFormatter
-
-        formatter = LocaleFormatter(language="en")
-
-        result = formatter.format_duration(0.5)
+        result = self.fmt_en.format_duration(0.5)
         self.assertIn("ms", result)
 
     def test_format_duration_seconds(self):
         """Test duration formatting for seconds."""
-        from cortex.i18n.formatter import LocaleFormatter
-
-        formatter = LocaleFormatter(language="en")
-
-        result = formatter.format_duration(45.2)
+        result = self.fmt_en.format_duration(45.2)
         self.assertIn("s", result)
         self.assertIn("45", result)
 
     def test_format_duration_minutes(self):
         """Test duration formatting for minutes."""
-        from cortex.i18n.formatter import LocaleFormatter
-
-        formatter = LocaleFormatter(language="en")
-
-        result = formatter.format_duration(150)  # 2m 30s
+        result = self.fmt_en.format_duration(150)  # 2m 30s
         self.assertIn("m", result)
 
     def test_format_duration_hours(self):
         """Test duration formatting for hours."""
-        from cortex.i18n.formatter import LocaleFormatter
-
-        formatter = LocaleFormatter(language="en")
-
-        result = formatter.format_duration(3700)  # 1h 1m
+        result = self.fmt_en.format_duration(3700)  # 1h 1m
         self.assertIn("h", result)
 
+    def test_format_duration_boundaries(self):
+        """Test exact duration output at unit switches and rounding edges."""
+        cases = {
+            0: "0ms",
+            0.5: "500ms",
+            0.9999: "1000ms",
+            1: "1.0s",
+            59.99: "60.0s",
+            60: "1m",
+            60.5: "1m",
+            61: "1m 1s",
+            119.9: "1m 59s",
+            3599: "59m 59s",
+            3599.9: "59m 59s",
+            3600: "1h",
+            3601: "1h",
+            3660: "1h 1m",
+            86400: "24h",
+        }
+        for seconds, expected in cases.items():
+            with self.subTest(seconds=seconds):
+                self.assertEqual(self.fmt_en.format_duration(seconds), expected)
+
     def test_formatter_language_setter(self):
         """Test setting language on formatter."""
-        from cortex.i18n.formatter import LocaleFormatter
-
         formatter = LocaleFormatter(language="en")
         self.assertEqual(formatter.language, "en")
 
@@ -747,8 +1000,6 @@ class TestLocaleFormatter(unittest.TestCase):
 
     def test_formatter_invalid_language_fallback(self):
         """Test that invalid language falls back to English."""
-        from cortex.i18n.formatter import LocaleFormatter
-
         formatter = LocaleFormatter(language="invalid")
         self.assertEqual(formatter.language, "en")
 
@@ -756,60 +1007,49 @@ class TestLocaleFormatter(unittest.TestCase):
 class TestSupportedLanguages(unittest.TestCase):
     """Tests for supported languages metadata."""
 
-    def test_all_supported_languages_have_catalogs(self):
-        """Test that all supported languages have message catalogs."""
-        import importlib.resources
-
-        from cortex.i18n.translator import SUPPORTED_LANGUAGES
-
+    @classmethod
+    def setUpClass(cls):
+        """Resolve the locales directory once for the class."""
         # Use importlib.resources for robust path resolution that works
         # regardless of how the package is installed or test is invoked
         try:
-            # Python 3.9+ API
-            locales_pkg = importlib.resources.files("cortex.i18n") / "locales"
-            for lang_code in SUPPORTED_LANGUAGES:
-                catalog_file = locales_pkg / f"{lang_code}.yaml"
-                # Check if the resource exists using is_file() or traversable API
-                self.assertTrue(
-                    catalog_file.is_file(),
-                    f"Missing catalog for language: {lang_code}",
-                )
+            cls._locales_pkg = importlib.resources.files("cortex.i18n") / "locales"
         except (TypeError, AttributeError):
             # Fallback for older Python versions
-            from pathlib import Path
+            cls._locales_pkg = Path(__file__).parent.parent / "cortex" / "i18n" / "locales"
 
-            locales_dir = Path(__file__).parent.parent / "cortex" / "i18n" / "locales"
-            for lang_code in SUPPORTED_LANGUAGES:
-                catalog_path = locales_dir / f"{lang_code}.yaml"
-                self.assertTrue(catalog_path.exists(), f"Missing catalog for language: {lang_code}")
+    def test_all_supported_languages_have_catalogs(self):
+        """Test that all supported languages have message catalogs."""
+        for lang_code in SUPPORTED_LANGUAGES:
+            with self.subTest(lang=lang_code):
+                self.assertTrue(
+                    (self._locales_pkg / f"{lang_code}.yaml").is_file(),
+                    f"Missing catalog for language: {lang_code}",
+                )
 
     def test_all_languages_have_metadata(self):
         """Test that all supported languages have name and native fields."""
-        from cortex.i18n.translator import SUPPORTED_LANGUAGES
-
         for lang_code, info in SUPPORTED_LANGUAGES.items():
             self.assertIn("name", info, f"Missing 'name' for {lang_code}")
             self.assertIn("native", info, f"Missing 'native' for {lang_code}")
 
     def test_required_languages_supported(self):
         """Test that all required languages are supported."""
-        from cortex.i18n.translator import SUPPORTED_LANGUAGES
-
-        required = ["en", "es", "fr", "de", "zh"]
-        for lang in required:
-            self.assertIn(lang, SUPPORTED_LANGUAGES)
+        required = {"en", "es", "fr", "de", "zh"}
+        self.assertLessEqual(required, SUPPORTED_LANGUAGES.keys())
 
 
 class TestTranslationCompleteness(unittest.TestCase):
     """Tests to verify translation completeness."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Create one translator per language and collect the English key set."""
+        cls._translators = {lang: Translator(language=lang) for lang in SUPPORTED_LANGUAGES}
+        cls._en_keys = frozenset(cls._translators["en"].get_all_keys("en"))
+
     def test_all_languages_have_common_keys(self):
         """Test that all languages have the common keys."""
-        from cortex.i18n.translator import SUPPORTED_LANGUAGES, Translator
-
-        translator = Translator(language="en")
-        en_keys = translator.get_all_keys("en")
-
         common_keys = [
             "common.success",
             "common.error",
@@ -817,7 +1057,9 @@ class TestTranslationCompleteness(unittest.TestCase):
             "install.success",
             "language.changed",
         ]
+        self.assertLessEqual(set(common_keys), self._en_keys)
 
+        translator = Translator(language="en")
         for lang in SUPPORTED_LANGUAGES:
             translator.language = lang
             for key in common_keys:
@@ -826,153 +1068,142 @@ class TestTranslationCompleteness(unittest.TestCase):
 
     def test_no_english_leaks_in_spanish(self):
         """Test that Spanish doesn't have English strings for key messages."""
-        from cortex.i18n.translator import Translator
-
-        translator = Translator(language="es")
-
         # These should NOT be English
-        success = translator.translate("common.success")
+        success = self._translators["es"].translate("common.success")
         self.assertNotEqual(success, "Success")
         self.assertEqual(success, "Éxito")
 
     def test_variable_interpolation_all_languages(self):
         """Test that variable interpolation works in all languages."""
-        from cortex.i18n.translator import SUPPORTED_LANGUAGES, Translator
-
+        translator = Translator()
         for lang in SUPPORTED_LANGUAGES:
-            translator = Translator(language=lang)
+            translator.language = lang
             result = translator.translate("language.changed", language="Test")
             self.assertIn("Test", result, f"Interpolation failed for {lang}")
             self.assertNotIn("{language}", result, f"Variable not replaced in {lang}")
 
 
-class TestCLIIntegration(unittest.TestCase):
-    """Tests for CLI integration with i18n."""
+class TestCLIIntegrationReadOnly(unittest.TestCase):
+    """Tests for CLI integration with i18n that don't change the home directory."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.TemporaryDirectory()
-        self.temp_home = Path(self.temp_dir.name)
-
-        from cortex.i18n.translator import reset_translator
-
-        reset_translator()
+    @classmethod
+    def setUpClass(cls):
+        """Share one temp home directory across the class."""
+        temp_dir = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(temp_dir.cleanup)
+        cls.temp_home = Path(temp_dir.name)
 
-    def tearDown(self):
-        """Clean up after tests."""
-        self.temp_dir.cleanup()
+        home_patcher = patch("pathlib.Path.home", return_value=cls.temp_home)
+        home_patcher.start()
+        cls.addClassCleanup(home_patcher.stop)
 
-        from cortex.i18n.translator import reset_translator
-
-        reset_translator()
+    def setUp(self):
+        """Isolate each test from the global translator."""
+        enter_translator_sandbox(self)
 
     def test_cli_language_list(self):
         """Test CLI language list command."""
-        from unittest.mock import patch
-
-        with patch("pathlib.Path.home", return_value=self.temp_home):
-            import argparse
-
-            from cortex.cli import CortexCLI
+        cli = CortexCLI()
+        args = argparse.Namespace(config_action="language", list=True, info=False, code=None)
 
-            cli = CortexCLI()
-            args = argparse.Namespace(config_action="language", list=True, info=False, code=None)
-
-            result = cli.config(args)
-            self.assertEqual(result, 0)
+        result = cli.config(args)
+        self.assertEqual(result, 0)
 
-    def test_cli_language_set(self):
-        """Test CLI language set command."""
-        with patch("pathlib.Path.home", return_value=self.temp_home):
-            import argparse
+    def test_cli_language_invalid(self):
+        """Test CLI with invalid language code."""
+        cli = CortexCLI()
+        args = argparse.Namespace(config_action="language", list=False, info=False, code="invalid")
 
-            from cortex.cli import CortexCLI
+        result = cli.config(args)
+        self.assertEqual(result, 1)
 
-            cli = CortexCLI()
-            args = argparse.Namespace(config_action="language", list=False, info=False, code="es")
 
-            result = cli.config(args)
-            self.assertEqual(result, 0)
+class TestCLIIntegrationMutating(unittest.TestCase):
+    """Tests for CLI integration with i18n that write preferences."""
 
-            # Verify language was set
-            from cortex.i18n.config import LanguageConfig
+    def setUp(self):
+        """Set up test fixtures with temp directory as the home directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.temp_home = Path(self.temp_dir.name)
 
-            config = LanguageConfig()
-            self.assertEqual(config.get_language(), "es")
+        self._home_patcher = patch("pathlib.Path.home", return_value=self.temp_home)
+        self._home_patcher.start()
+        self.addCleanup(self._home_patcher.stop)
 
-    def test_cli_language_invalid(self):
-        """Test CLI with invalid language code."""
-        with patch("pathlib.Path.home", return_value=self.temp_home):
-            import argparse
+        enter_translator_sandbox(self)
 
-            from cortex.cli import CortexCLI
+    def test_cli_language_set(self):
+        """Test CLI language set command."""
+        cli = CortexCLI()
+        args = argparse.Namespace(config_action="language", list=False, info=False, code="es")
 
-            cli = CortexCLI()
-            args = argparse.Namespace(
-                config_action="language", list=False, info=False, code="invalid"
-            )
+        result = cli.config(args)
+        self.assertEqual(result, 0)
 
-            result = cli.config(args)
-            self.assertEqual(result, 1)
+        # Verify language was set
+        config = LanguageConfig()
+        self.assertEqual(config.get_language(), "es")
 
     def test_cli_language_auto(self):
         """Test CLI language auto detection."""
-        with patch("pathlib.Path.home", return_value=self.temp_home):
-            with patch.dict(os.environ, {}, clear=True):
-                import argparse
-
-                from cortex.cli import CortexCLI
-
-                cli = CortexCLI()
+        with patch.dict(os.environ, {}, clear=True):
+            cli = CortexCLI()
 
-                # First set a language
-                args = argparse.Namespace(
-                    config_action="language", list=False, info=False, code="de"
-                )
-                cli.config(args)
+            # First set a language
+            args = argparse.Namespace(config_action="language", list=False, info=False, code="de")
+            cli.config(args)
 
-                # Then set to auto
-                args = argparse.Namespace(
-                    config_action="language", list=False, info=False, code="auto"
-                )
-                result = cli.config(args)
-                self.assertEqual(result, 0)
+            # Then set to auto
+            args = argparse.Namespace(config_action="language", list=False, info=False, code="auto")
+            result = cli.config(args)
+            self.assertEqual(result, 0)
 
 
 class TestGlobalFunctions(unittest.TestCase):
     """Tests for global convenience functions."""
 
     def setUp(self):
-        """Reset translator before each test."""
-        from cortex.i18n.translator import reset_translator
-
-        reset_translator()
-
-    def tearDown(self):
-        """Reset translator after each test."""
-        from cortex.i18n.translator import reset_translator
-
-        reset_translator()
+        """Isolate each test from the global translator."""
+        enter_translator_sandbox(self)
 
     def test_format_functions(self):
         """Test global format functions."""
-        from cortex.i18n.formatter import (
-            format_date,
-            format_datetime,
-            format_duration,
-            format_file_size,
-            format_number,
-            format_time,
+        dt = datetime(2024, 3, 15, 14, 30)
+
+        calls = (
+            (format_date, dt),
+            (format_time, dt),
+            (format_datetime, dt),
+            (format_number, 1234),
+            (format_file_size, 1024),
+            (format_duration, 60),
         )
+        for fn, value in calls:
+            with self.subTest(fn=fn.__name__):
+                self.assertIsInstance(fn(value), str)
 
-        dt = datetime(2024, 3, 15, 14, 30)
+    def test_language_info_functions(self):
+        """Test language info helpers return shared read-only mappings."""
+        set_language("es")
+        info = get_language_info()
+        self.assertEqual(dict(info), {"code": "es", "name": "Spanish", "native": "Español"})
+        self.assertIs(get_language_info(), info)
+        with self.assertRaises(TypeError):
+            info["code"] = "fr"
+
+        languages = get_supported_languages()
+        self.assertEqual(languages["de"]["native"], "Deutsch")
+        with self.assertRaises(TypeError):
+            languages["xx"] = {}
+
+    def test_format_functions_follow_language_change(self):
+        """Test global format functions pick up language changes."""
+        set_language("en")
+        self.assertEqual(format_number(1234), "1,234")
 
-        self.assertIsInstance(format_date(dt), str)
-        self.assertIsInstance(format_time(dt), str)
-        self.assertIsInstance(format_datetime(dt), str)
-        self.assertIsInstance(format_number(1234), str)
-        self.assertIsInstance(format_file_size(1024), str)
-        self.assertIsInstance(format_duration(60), str)
+        set_language("de")
+        self.assertEqual(format_number(1234), "1.234")
 
 
 class TestResolveLanguageName(unittest.TestCase):
@@ -980,8 +1211,6 @@ class TestResolveLanguageName(unittest.TestCase):
 
     def test_resolve_language_code(self):
         """Test resolving language codes."""
-        from cortex.cli import _resolve_language_name
-
         self.assertEqual(_resolve_language_name("en"), "en")
         self.assertEqual(_resolve_language_name("es"), "es")
         self.assertEqual(_resolve_language_name("fr"), "fr")
@@ -990,8 +1219,6 @@ class TestResolveLanguageName(unittest.TestCase):
 
     def test_resolve_english_names(self):
         """Test resolving English language names."""
-        from cortex.cli import _resolve_language_name
-
         self.assertEqual(_resolve_language_name("English"), "en")
         self.assertEqual(_resolve_language_name("Spanish"), "es")
         self.assertEqual(_resolve_language_name("French"), "fr")
@@ -1000,8 +1227,6 @@ class TestResolveLanguageName(unittest.TestCase):
 
     def test_resolve_native_names(self):
         """Test resolving native language names."""
-        from cortex.cli import _resolve_language_name
-
         self.assertEqual(_resolve_language_name("Español"), "es")
         self.assertEqual(_resolve_language_name("Français"), "fr")
         self.assertEqual(_resolve_language_name("Deutsch"), "de")
@@ -1009,8 +1234,6 @@ class TestResolveLanguageName(unittest.TestCase):
 
     def test_resolve_case_insensitive(self):
         """Test case-insensitive resolution."""
-        from cortex.cli import _resolve_language_name
-
         self.assertEqual(_resolve_language_name("ENGLISH"), "en")
         self.assertEqual(_resolve_language_name("spanish"), "es")
         self.assertEqual(_resolve_language_name("FRENCH"), "fr")
@@ -1018,16 +1241,18 @@ class TestResolveLanguageName(unittest.TestCase):
 
     def test_resolve_invalid_returns_none(self):
         """Test that invalid language names return None."""
-        from cortex.cli import _resolve_language_name
-
         self.assertIsNone(_resolve_language_name("Japanese"))
         self.assertIsNone(_resolve_language_name("invalid"))
         self.assertIsNone(_resolve_language_name(""))
 
+    def test_resolve_partial_names_return_none(self):
+        """Test that prefixes and substrings of known names are not matched."""
+        for partial in ("Span", "Englis", "Deutsc", "Fran", "中"):
+            with self.subTest(partial=partial):
+                self.assertIsNone(_resolve_language_name(partial))
+
     def test_resolve_non_latin_scripts_no_collision(self):
         """Test that non-Latin scripts don't create key collisions."""
-        from cortex.cli import _resolve_language_name
-
         # Chinese should resolve correctly
         self.assertEqual(_resolve_language_name("中文"), "zh")
 
@@ -1037,82 +1262,80 @@ class TestResolveLanguageName(unittest.TestCase):
 
     def test_resolve_mixed_case_non_latin(self):
         """Test that non-Latin scripts are matched exactly."""
-        from cortex.cli import _resolve_language_name
-
         # Non-Latin script should work exactly as-is
         self.assertEqual(_resolve_language_name("中文"), "zh")
 
+    def test_resolve_uses_prebuilt_table(self):
+        """Test that resolving names doesn't rebuild the alias table."""
+        with patch("cortex.cli._build_name_to_code") as build:
+            self.assertEqual(_resolve_language_name("Deutsch"), "de")
+        build.assert_not_called()
+
     def test_resolve_with_whitespace(self):
         """Test that whitespace is handled."""
-        from cortex.cli import _resolve_language_name
-
         self.assertEqual(_resolve_language_name("  English  "), "en")
         self.assertEqual(_resolve_language_name(" es "), "es")
 
 
-class TestSetLanguageFlag(unittest.TestCase):
-    """Tests for the --set-language CLI flag."""
+class TestSetLanguageFlagReadOnly(unittest.TestCase):
+    """Tests for the --set-language CLI flag that don't change the home directory."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Share one temp home directory across the class."""
+        temp_dir = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(temp_dir.cleanup)
+        cls.temp_home = Path(temp_dir.name)
+
+        home_patcher = patch("pathlib.Path.home", return_value=cls.temp_home)
+        home_patcher.start()
+        cls.addClassCleanup(home_patcher.stop)
 
     def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.TemporaryDirectory()
-        self.temp_home = Path(self.temp_dir.name)
+        """Isolate each test from the global translator."""
+        enter_translator_sandbox(self)
 
-        from cortex.i18n.translator import reset_translator
+    def test_set_language_flag_invalid(self):
+        """Test --set-language with invalid language."""
+        result = _handle_set_language("InvalidLanguage")
+        self.assertEqual(result, 1)
 
-        reset_translator()
 
-    def tearDown(self):
-        """Clean up after tests."""
-        self.temp_dir.cleanup()
+class TestSetLanguageFlagMutating(unittest.TestCase):
+    """Tests for the --set-language CLI flag that write preferences."""
 
-        from cortex.i18n.translator import reset_translator
+    def setUp(self):
+        """Set up test fixtures with temp directory as the home directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.temp_home = Path(self.temp_dir.name)
 
-        reset_translator()
+        self._home_patcher = patch("pathlib.Path.home", return_value=self.temp_home)
+        self._home_patcher.start()
+        self.addCleanup(self._home_patcher.stop)
+
+        enter_translator_sandbox(self)
 
     def test_set_language_flag_with_english_name(self):
         """Test --set-language with English language name."""
-        with patch("pathlib.Path.home", return_value=self.temp_home):
-            from cortex.cli import _handle_set_language
-
-            result = _handle_set_language("Spanish")
-            self.assertEqual(result, 0)
+        result = _handle_set_language("Spanish")
+        self.assertEqual(result, 0)
 
-            from cortex.i18n import get_language
-
-            self.assertEqual(get_language(), "es")
+        self.assertEqual(get_language(), "es")
 
     def test_set_language_flag_with_native_name(self):
         """Test --set-language with native language name."""
-        with patch("pathlib.Path.home", return_value=self.temp_home):
-            from cortex.cli import _handle_set_language
+        result = _handle_set_language("Français")
+        self.assertEqual(result, 0)
 
-            result = _handle_set_language("Français")
-            self.assertEqual(result, 0)
-
-            from cortex.i18n import get_language
-
-            self.assertEqual(get_language(), "fr")
+        self.assertEqual(get_language(), "fr")
 
     def test_set_language_flag_with_code(self):
         """Test --set-language with language code."""
-        with patch("pathlib.Path.home", return_value=self.temp_home):
-            from cortex.cli import _handle_set_language
-
-            result = _handle_set_language("de")
-            self.assertEqual(result, 0)
-
-            from cortex.i18n import get_language
-
-            self.assertEqual(get_language(), "de")
-
-    def test_set_language_flag_invalid(self):
-        """Test --set-language with invalid language."""
-        with patch("pathlib.Path.home", return_value=self.temp_home):
-            from cortex.cli import _handle_set_language
+        result = _handle_set_language("de")
+        self.assertEqual(result, 0)
 
-            result = _handle_set_language("InvalidLanguage")
-            self.assertEqual(result, 1)
+        self.assertEqual(get_language(), "de")
 
 
 if __name__ == "__main__":
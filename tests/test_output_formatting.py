@@ -5,12 +5,14 @@ Issue: #242 - Output Polish: Rich Formatting with Colors, Boxes, Spinners
 """
 
 import io
-from unittest.mock import patch
+import time
+from unittest.mock import MagicMock, patch
 
 import pytest
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
+from rich.text import Text
 
 from cortex.branding import (
     CORTEX_CYAN,
@@ -18,6 +20,7 @@ from cortex.branding import (
     CORTEX_SUCCESS,
     CORTEX_WARNING,
     cx_box,
+    cx_buffered,
     cx_divider,
     cx_error,
     cx_header,
@@ -33,10 +36,12 @@ from cortex.branding import (
 )
 from cortex.output_formatter import (
     COLORS,
+    SPINNER_UPDATE_INTERVAL,
     STATUS_ICONS,
     MultiStepProgress,
     OutputStyle,
     ProgressTracker,
+    StatusBox,
     StatusInfo,
     TableColumn,
     format_box,
@@ -49,7 +54,9 @@ from cortex.output_formatter import (
     print_error,
     print_info,
     print_success,
+    print_table_stream,
     print_warning,
+    spinner_context,
 )
 
 
@@ -118,6 +125,27 @@ class TestCxPrint:
         captured = capsys.readouterr()
         assert "Thinking message" in captured.out
 
+    def test_cx_print_renders_message_markup(self, capsys):
+        """Test markup inside the message is still interpreted."""
+        cx_print("Run [bold]cortex wizard[/bold] now", "info")
+        captured = capsys.readouterr()
+        assert "Run cortex wizard now" in captured.out
+        assert "[bold]" not in captured.out
+
+
+class TestCxBuffered:
+    """Tests for cx_buffered context manager."""
+
+    def test_output_written_on_exit(self, capsys):
+        """Test buffered output is held until the block exits."""
+        with cx_buffered():
+            cx_print("First", "info")
+            cx_print("Second", "success")
+            assert capsys.readouterr().out == ""
+        captured = capsys.readouterr()
+        assert "First" in captured.out
+        assert "Second" in captured.out
+
 
 class TestCxStep:
     """Tests for cx_step function."""
@@ -149,6 +177,12 @@ class TestCxHeader:
         assert "Test Section" in captured.out
         assert "━" in captured.out
 
+    def test_cx_header_surrounding_blank_lines(self, capsys):
+        """Test header is printed between blank lines."""
+        cx_header("Test Section")
+        captured = capsys.readouterr()
+        assert captured.out.splitlines() == ["", "━━━ Test Section ━━━", ""]
+
 
 class TestCxBox:
     """Tests for cx_box function."""
@@ -206,6 +240,13 @@ class TestCxStatusBox:
         assert "Short" in captured.out
         assert "LongerLabel" in captured.out
 
+    def test_status_box_values_rendered_literally(self, capsys):
+        """Test that bracketed values are not treated as markup."""
+        cx_status_box("Test", [("Path", "[/etc/cortex]", "info"), ("Tag", "[bold]", "default")])
+        captured = capsys.readouterr()
+        assert "[/etc/cortex]" in captured.out
+        assert "[bold]" in captured.out
+
 
 class TestCxTable:
     """Tests for cx_table function."""
@@ -314,6 +355,13 @@ class TestStatusMessages:
         assert "ℹ" in captured.out
         assert "Note" in captured.out
 
+    def test_cx_info_prefix_not_mutated(self, capsys):
+        """Test repeated calls each start from a fresh copy of the prefix."""
+        cx_info("First [bold]note[/bold]")
+        cx_info("Second")
+        lines = capsys.readouterr().out.splitlines()
+        assert lines == ["ℹ First note", "ℹ Second"]
+
 
 class TestOutputFormatterBox:
     """Tests for output_formatter box functions."""
@@ -338,6 +386,22 @@ class TestOutputFormatterBox:
         assert isinstance(result, Panel)
 
 
+class TestStatusBox:
+    """Tests for the reusable StatusBox."""
+
+    def test_status_box_reuses_panel(self, capsys):
+        """Test updates keep the same panel and replace its content."""
+        status_box = StatusBox("Scheduler")
+        first = status_box.update([StatusInfo("Uptime", "1s")])
+        status_box.show([StatusInfo("Uptime", "2s", OutputStyle.SUCCESS)])
+
+        assert status_box.panel is first
+        captured = capsys.readouterr()
+        assert "Scheduler" in captured.out
+        assert "2s" in captured.out
+        assert "1s" not in captured.out
+
+
 class TestOutputFormatterTable:
     """Tests for output_formatter table functions."""
 
@@ -356,6 +420,23 @@ class TestOutputFormatterTable:
         )
         assert isinstance(result, Table)
 
+    def test_format_table_accepts_non_string_cells(self):
+        """Test numeric cells are converted and renderables kept as-is."""
+        table = format_table(
+            columns=[TableColumn("Name"), TableColumn("Count")],
+            rows=[[Text("pkg", style="bold"), 42], ["other", 3.5]],
+        )
+        assert list(table.columns[1].cells) == ["42", "3.5"]
+        assert isinstance(next(iter(table.columns[0].cells)), Text)
+
+    def test_format_package_table_calls_are_independent(self):
+        """Test repeated package tables do not share rows."""
+        first = format_package_table(packages=[("pkg", "1.0", "Install")])
+        second = format_package_table(packages=[("a", "1", "Install"), ("b", "2", "Remove")])
+        assert [col.header for col in second.columns] == ["Package", "Version", "Action"]
+        assert first.row_count == 1
+        assert second.row_count == 2
+
     def test_table_column_defaults(self):
         """Test TableColumn default values."""
         col = TableColumn("Test")
@@ -460,6 +541,65 @@ class TestPrintFunctions:
         captured = capsys.readouterr()
         assert "━" in captured.out
 
+    def test_print_table_stream(self, capsys):
+        """Test print_table_stream renders rows from a generator once."""
+        columns = [TableColumn("Name"), TableColumn("Size")]
+        for refresh_every in (None, 2):
+            rows = ((f"pkg{i}", i * 10) for i in range(3))
+            print_table_stream(columns, rows, refresh_every=refresh_every, title="Stream")
+            captured = capsys.readouterr()
+            assert captured.out.count("Stream") == 1
+            assert "pkg2" in captured.out
+            assert "20" in captured.out
+
+
+class TestSpinnerContext:
+    """Tests for spinner_context update throttling."""
+
+    def _run(self, body):
+        """Run body(spinner, status) inside spinner_context; return the wrapped Status."""
+        status = MagicMock()
+        with patch("cortex.output_formatter.console") as mock_console:
+            mock_console.status.return_value.__enter__.return_value = status
+            with spinner_context("Working") as spinner:
+                body(spinner, status)
+        return status
+
+    def test_spinner_updates_are_throttled(self):
+        """Test rapid updates are coalesced and the last one is kept."""
+
+        def body(spinner, status):
+            spinner.update("one")
+            spinner.update("two")
+            spinner.update("three")
+
+        status = self._run(body)
+        assert [c.args[0] for c in status.update.call_args_list] == ["one", "three"]
+
+    def test_held_update_shown_after_interval(self):
+        """Test a held message is shown once the interval passes, mid-context."""
+        shown = []
+
+        def body(spinner, status):
+            spinner.update("step 1")
+            spinner.update("step 2")
+            time.sleep(SPINNER_UPDATE_INTERVAL * 3)
+            shown.extend(c.args[0] for c in status.update.call_args_list)
+
+        self._run(body)
+        assert shown == ["step 1", "step 2"]
+
+    def test_held_update_flushed_on_exit(self):
+        """Test leaving the context shows the held message exactly once."""
+
+        def body(spinner, status):
+            spinner.update("a")
+            spinner.update("b")
+
+        status = self._run(body)
+        time.sleep(SPINNER_UPDATE_INTERVAL * 2)
+        assert [c.args[0] for c in status.update.call_args_list] == ["a", "b"]
+
 
 class TestProgressTracker:
     """Tests for ProgressTracker class."""
@@ -482,6 +622,19 @@ class TestProgressTracker:
             tracker.update("New description", advance=2)
             # Should not raise
 
+    def test_progress_trackers_share_stateless_columns(self):
+        """Test sequential trackers reuse columns but not stateful ones."""
+        with ProgressTracker("First", total=2) as first:
+            first.advance(2)
+        with ProgressTracker("Second", total=2) as second:
+            second.advance(2)
+
+        first_columns = first._progress.columns
+        second_columns = second._progress.columns
+        assert first_columns[1] is second_columns[1]
+        assert first_columns[0] is not second_columns[0]
+        assert first_columns[-1] is not second_columns[-1]
+
 
 class TestMultiStepProgress:
     """Tests for MultiStepProgress class."""
@@ -1,3 +1,6 @@
+import json
+from pathlib import Path
+
 import pytest
 
 import cortex.stack_manager as stack_manager
@@ -9,7 +12,54 @@ def test_suggest_stack_ml_gpu_and_cpu(monkeypatch: pytest.MonkeyPatch) -> None:
     manager = StackManager()
 
     monkeypatch.setattr(stack_manager, "has_nvidia_gpu", lambda: False)
+    stack_manager.reset_gpu_cache()
     assert manager.suggest_stack("ml") == "ml-cpu"
 
     monkeypatch.setattr(stack_manager, "has_nvidia_gpu", lambda: True)
+    stack_manager.reset_gpu_cache()
+    assert manager.suggest_stack("ml") == "ml"
+
+    stack_manager.reset_gpu_cache()
+
+
+def test_suggest_stack_caches_gpu_detection(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that GPU detection runs only once across suggest_stack calls."""
+    calls = []
+
+    def fake_has_nvidia_gpu() -> bool:
+        calls.append(True)
+        return True
+
+    monkeypatch.setattr(stack_manager, "has_nvidia_gpu", fake_has_nvidia_gpu)
+    stack_manager.reset_gpu_cache()
+
+    manager = StackManager()
+    assert manager.suggest_stack("ml") == "ml"
     assert manager.suggest_stack("ml") == "ml"
+    assert len(calls) == 1
+
+    stack_manager.reset_gpu_cache()
+
+
+def test_find_stack_uses_id_index() -> None:
+    """Test that stacks are found by id and unknown ids return None."""
+    manager = StackManager()
+
+    for stack in manager.list_stacks():
+        assert manager.find_stack(stack["id"]) is stack
+
+    assert manager.find_stack("does-not-exist") is None
+    assert manager.get_stack_packages("does-not-exist") == []
+
+
+def test_load_stacks_skips_entries_without_id(tmp_path: Path) -> None:
+    """Test that a stack entry missing its id doesn't break loading."""
+    stacks_file = tmp_path / "stacks.json"
+    stacks_file.write_text(
+        json.dumps({"stacks": [{"name": "No id"}, {"id": "web", "packages": ["nginx"]}]})
+    )
+    manager = StackManager()
+    manager.stacks_file = stacks_file
+
+    assert len(manager.list_stacks()) == 2
+    assert manager.get_stack_packages("web") == ["nginx"]